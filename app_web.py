@@ -1,2250 +1,95 @@
+import time
+t_rerun = time.perf_counter()
 import streamlit as st
-import pandas as pd
-import urllib.parse
-from sqlalchemy import create_engine, text
 import datetime
-import time
-import mysql.connector
-import pytz
-import numpy as np
+from sincronizacion import (
+    zona_local, crear_motores, crear_recursos, salud_conexiones, Planificador,
+    leer_historial, percentiles_etapas, PRESUPUESTO_RERUN_MS,
+)
 
 # --- 1. CONFIGURACIÓN ---
-zona_local = pytz.timezone('America/Mexico_City')
 st.set_page_config(page_title="MIAA Control Maestro", layout="wide")
 
 # Credenciales
 DB_SCADA = dict(st.secrets["db_scada"])
 DB_INFORME = dict(st.secrets["db_informe"])
 DB_POSTGRES = dict(st.secrets["db_postgres"])
-CSV_URL = 'https://docs.google.com/spreadsheets/d/1tHh47x6DWZs_vCaSCHshYPJrQKUW7Pqj86NCVBxKnuw/gviz/tq?tqx=out:csv&sheet=informe'
-
-# Mapeo Completo Integrado
-MAPEO_POSTGRES = {
-    'GASTO_(l.p.s.)':                  '_Caudal',
-    'PRESION_(kg/cm2)':                '_Presion',
-    'LONGITUD_DE_COLUMNA':             '_Long_colum',
-    'COLUMNA_DIAMETRO_1':              '_Diam_colum',
-    'TIPO_COLUMNA':                    '_Tipo_colum',
-    'SECTOR_HIDRAULICO':               '_Sector',
-    'NIVEL_DINAMICO_(mts)':            '_Nivel_Din',
-    'NIVEL_ESTATICO_(mts)':            '_Nivel_Est',
-    'EXTRACCION_MENSUAL_(m3)':         '_Vm_estr',
-    'HORAS_DE_OPERACIÓN_DIARIA_(hrs)': '_Horas_op',
-    'DISTRITO_1':                      '_Distrito',
-    'ESTATUS':                         '_Estatus',
-    'TELEMETRIA':                      '_Telemetria',
-    'FECHA_ACTUALIZACION':             '_Ultima_actualizacion'
-}
-
-MAPEO_SCADA = {
-"P-002": {
-"GASTO_(l.p.s.)":"PZ_002_TRC_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_002_TRC_PRES_INS",
-"VOLTAJE_L1":"PZ_002_TRC_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_002_TRC_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_002_TRC_VOL_L1_L3",
-"AMP_L1":"PZ_002_TRC_CORR_L1",
-"AMP_L2":"PZ_002_TRC_CORR_L2",
-"AMP_L3":"PZ_002_TRC_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_002_TRC_LONG_COLUM",
-"SUMERGENCIA":"PZ_002_TRC_SUMERG",
-"NIVEL_DINAMICO":"PZ_002_TRC_NIV_EST",
-},
-
-"P-003": {
-"GASTO_(l.p.s.)":"PZ_003_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_003_PRES_INS",
-"VOLTAJE_L1":"PZ_003_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_003_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_003_VOL_L1_L3",
-"AMP_L1":"PZ_003_CORR_L1",
-"AMP_L2":"PZ_003_CORR_L2",
-"AMP_L3":"PZ_003_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_003_LONG_COLUM",
-"SUMERGENCIA":"PZ_003_SUMERG",
-"NIVEL_DINAMICO":"PZ_003_NIV_EST",
-},
-
-"P-004": {
-"GASTO_(l.p.s.)":"PZ_004_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_004_PRES_INS",
-"VOLTAJE_L1":"PZ_004_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_004_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_004_VOL_L1_L3",
-"AMP_L1":"PZ_004_CORR_L1",
-"AMP_L2":"PZ_004_CORR_L2",
-"AMP_L3":"PZ_004_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_004_LONG_COLUM",
-"SUMERGENCIA":"PZ_004_SUMERG",
-"NIVEL_DINAMICO":"PZ_004_NIV_EST",
-},
-
-"P-005A": {
-"GASTO_(l.p.s.)":"PZ_RP_005_TRHDAS_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_RP_005_TRHDAS_PRES_INS",
-"VOLTAJE_L1":"PZ_RP_005_TRHDAS_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_RP_005_TRHDAS_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_RP_005_TRHDAS_VOL_L1_L3",
-"AMP_L1":"PZ_RP_005_TRHDAS_CORR_L1",
-"AMP_L2":"PZ_RP_005_TRHDAS_CORR_L2",
-"AMP_L3":"PZ_RP_005_TRHDAS_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_RP_005_TRHDAS_LONG_COLUM",
-"SUMERGENCIA":"PZ_RP_005_TRHDAS_SUMERG",
-"NIVEL_DINAMICO":"PZ_RP_005_TRHDAS_NIV_EST",
-},
-
-"P-006": {
-"GASTO_(l.p.s.)":"PZ_006_TRC_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_006_TRC_PRES_INS",
-"VOLTAJE_L1":"PZ_006_TRC_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_006_TRC_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_006_TRC_VOL_L1_L3",
-"AMP_L1":"PZ_006_TRC_CORR_L1",
-"AMP_L2":"PZ_006_TRC_CORR_L2",
-"AMP_L3":"PZ_006_TRC_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_006_TRC_LONG_COLUM",
-"SUMERGENCIA":"PZ_006_TRC_SUMERG",
-"NIVEL_DINAMICO":"PZ_006_TRC_NIV_EST",
-},
-
-"P-008": {
-"GASTO_(l.p.s.)":"PZ_008_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_008_PRES_INS",
-"VOLTAJE_L1":"PZ_008_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_008_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_008_VOL_L1_L3",
-"AMP_L1":"PZ_008_CORR_L1",
-"AMP_L2":"PZ_008_CORR_L2",
-"AMP_L3":"PZ_008_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_008_LONG_COLUM",
-"SUMERGENCIA":"PZ_008_SUMERG",
-"NIVEL_DINAMICO":"PZ_008_NIV_EST",
-},
-
-"P-009": {
-"GASTO_(l.p.s.)":"PZ_009_TRJT_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_009_TRJT_PRES_INS",
-"VOLTAJE_L1":"PZ_009_TRJT_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_009_TRJT_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_009_TRJT_VOL_L1_L3",
-"AMP_L1":"PZ_009_TRJT_CORR_L1",
-"AMP_L2":"PZ_009_TRJT_CORR_L2",
-"AMP_L3":"PZ_009_TRJT_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_009_TRJT_LONG_COLUM",
-"SUMERGENCIA":"PZ_009_TRJT_SUMERG",
-"NIVEL_DINAMICO":"PZ_009_TRJT_NIV_EST",
-},
-
-"P-011": {
-"GASTO_(l.p.s.)":"PZ_011_TRJT_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_011_TRJT_PRES_INS",
-"VOLTAJE_L1":"PZ_011_TRJT_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_011_TRJT_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_011_TRJT_VOL_L1_L3",
-"AMP_L1":"PZ_011_TRJT_CORR_L1",
-"AMP_L2":"PZ_011_TRJT_CORR_L2",
-"AMP_L3":"PZ_011_TRJT_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_011_TRJT_LONG_COLUM",
-"SUMERGENCIA":"PZ_011_TRJT_SUMERG",
-"NIVEL_DINAMICO":"PZ_011_TRJT_NIV_EST",
-},
-
-"P-012": {
-"GASTO_(l.p.s.)":"PZ_TQ_012_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_TQ_012_PRES_INS",
-"VOLTAJE_L1":"PZ_TQ_012_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_TQ_012_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_TQ_012_VOL_L1_L3",
-"AMP_L1":"PZ_TQ_012_CORR_L1",
-"AMP_L2":"PZ_TQ_012_CORR_L2",
-"AMP_L3":"PZ_TQ_012_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_TQ_012_LONG_COLUM",
-"SUMERGENCIA":"PZ_TQ_012_SUMERG",
-"NIVEL_DINAMICO":"PZ_TQ_012_NIV_EST",
-},
-
-"P-013": {
-"GASTO_(l.p.s.)":"PZ_013_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_013_PRES_INS",
-"VOLTAJE_L1":"PZ_013_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_013_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_013_VOL_L1_L3",
-"AMP_L1":"PZ_013_CORR_L1",
-"AMP_L2":"PZ_013_CORR_L2",
-"AMP_L3":"PZ_013_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_013_LONG_COLUM",
-"SUMERGENCIA":"PZ_013_SUMERG",
-"NIVEL_DINAMICO":"PZ_013_NIV_EST",
-},
-
-"P-013": {
-"GASTO_(l.p.s.)":"PZ_013_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_013_PRES_INS",
-"VOLTAJE_L1":"PZ_013_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_013_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_013_VOL_L1_L3",
-"AMP_L1":"PZ_013_CORR_L1",
-"AMP_L2":"PZ_013_CORR_L2",
-"AMP_L3":"PZ_013_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_013_LONG_COLUM",
-"SUMERGENCIA":"PZ_013_SUMERG",
-"NIVEL_DINAMICO":"PZ_013_NIV_EST",
-},
-
-"P-014A": {
-"GASTO_(l.p.s.)":"PZ_022A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_022A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_022A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_022A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_022A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_022A_DR_CORR_L1",
-"AMP_L2":"PZ_022A_DR_CORR_L2",
-"AMP_L3":"PZ_022A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_022A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_022A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_022A_DR_NIV_EST",
-},
-
-"P-015": {
-"GASTO_(l.p.s.)":"PZ_015_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_015_PRES_INS",
-"VOLTAJE_L1":"PZ_015_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_015_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_015_VOL_L1_L3",
-"AMP_L1":"PZ_015_CORR_L1",
-"AMP_L2":"PZ_015_CORR_L2",
-"AMP_L3":"PZ_015_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_015_LONG_COLUM",
-"SUMERGENCIA":"PZ_015_SUMERG",
-"NIVEL_DINAMICO":"PZ_015_NIV_EST",
-},
-
-"P-016": {
-"GASTO_(l.p.s.)":"PZ_016_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_016_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_016_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_016_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_016_DR_VOL_L1_L3",
-"AMP_L1":"PZ_016_DR_CORR_L1",
-"AMP_L2":"PZ_016_DR_CORR_L2",
-"AMP_L3":"PZ_016_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_016_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_016_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_016_DR_NIV_EST",
-},
-
-"P-017A": {
-"GASTO_(l.p.s.)":"PZ_017A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_017A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_017A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_017A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_017A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_017A_DR_CORR_L1",
-"AMP_L2":"PZ_017A_DR_CORR_L2",
-"AMP_L3":"PZ_017A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_017A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_017A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_017A_DR_NIV_EST",
-},
-
-"P-018": {
-"GASTO_(l.p.s.)":"PZ_018_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_018_PRES_INS",
-"VOLTAJE_L1":"PZ_018_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_018_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_018_VOL_L1_L3",
-"AMP_L1":"PZ_018_CORR_L1",
-"AMP_L2":"PZ_018_CORR_L2",
-"AMP_L3":"PZ_018_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_018_LONG_COLUM",
-"SUMERGENCIA":"PZ_018_SUMERG",
-"NIVEL_DINAMICO":"PZ_018_NIV_EST",
-},
-
-"P-020A": {
-"GASTO_(l.p.s.)":"PZ_020A_TRMOL_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_020A_TRMOL_PRES_INS",
-"VOLTAJE_L1":"PZ_020A_TRMOL_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_020A_TRMOL_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_020A_TRMOL_VOL_L1_L3",
-"AMP_L1":"PZ_020A_TRMOL_CORR_L1",
-"AMP_L2":"PZ_020A_TRMOL_CORR_L2",
-"AMP_L3":"PZ_020A_TRMOL_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_020A_TRMOL_LONG_COLUM",
-"SUMERGENCIA":"PZ_020A_TRMOL_SUMERG",
-"NIVEL_DINAMICO":"PZ_020A_TRMOL_NIV_EST",
-},
-
-"P-021A": {
-"GASTO_(l.p.s.)":"PZ_021A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_021A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_021A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_021A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_021A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_021A_DR_CORR_L1",
-"AMP_L2":"PZ_021A_DR_CORR_L2",
-"AMP_L3":"PZ_021A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_021A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_021A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_021A_DR_NIV_EST",
-},
-
-"P-022A": {
-"GASTO_(l.p.s.)":"PZ_022AV2_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_022AV2_PRES_INS",
-"VOLTAJE_L1":"PZ_022AV2_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_022AV2_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_022AV2_VOL_L1_L3",
-"AMP_L1":"PZ_022AV2_CORR_L1",
-"AMP_L2":"PZ_022AV2_CORR_L2",
-"AMP_L3":"PZ_022AV2_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_022AV2_LONG_COLUM",
-"SUMERGENCIA":"PZ_022AV2_SUMERG",
-"NIVEL_DINAMICO":"PZ_022AV2_NIV_EST",
-},
-
-"P-023A": {
-"GASTO_(l.p.s.)":"PZ_023A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_023A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_023A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_023A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_023A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_023A_DR_CORR_L1",
-"AMP_L2":"PZ_023A_DR_CORR_L2",
-"AMP_L3":"PZ_023A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_023A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_023A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_023A_DR_NIV_EST",
-},
-
-"P-024": {
-"GASTO_(l.p.s.)":"PZ_024_TRC_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_024_TRC_PRES_INS",
-"VOLTAJE_L1":"PZ_024_TRC_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_024_TRC_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_024_TRC_VOL_L1_L3",
-"AMP_L1":"PZ_024_TRC_CORR_L1",
-"AMP_L2":"PZ_024_TRC_CORR_L2",
-"AMP_L3":"PZ_024_TRC_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_024_TRC_LONG_COLUM",
-"SUMERGENCIA":"PZ_024_TRC_SUMERG",
-"NIVEL_DINAMICO":"PZ_024_TRC_NIV_EST",
-},
-
-"P-025A": {
-"GASTO_(l.p.s.)":"PZ_025A_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_025A_PRES_INS",
-"VOLTAJE_L1":"PZ_025A_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_025A_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_025A_VOL_L1_L3",
-"AMP_L1":"PZ_025A_CORR_L1",
-"AMP_L2":"PZ_025A_CORR_L2",
-"AMP_L3":"PZ_025A_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_025A_LONG_COLUM",
-"SUMERGENCIA":"PZ_025A_SUMERG",
-"NIVEL_DINAMICO":"PZ_025A_NIV_EST",
-},
-
-"P-026A": {
-"GASTO_(l.p.s.)":"PZ_026A_TRMOL_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_026A_TRMOL_PRES_INS",
-"VOLTAJE_L1":"PZ_026A_TRMOL_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_026A_TRMOL_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_026A_TRMOL_VOL_L1_L3",
-"AMP_L1":"PZ_026A_TRMOL_CORR_L1",
-"AMP_L2":"PZ_026A_TRMOL_CORR_L2",
-"AMP_L3":"PZ_026A_TRMOL_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_026A_TRMOL_LONG_COLUM",
-"SUMERGENCIA":"PZ_026A_TRMOL_SUMERG",
-"NIVEL_DINAMICO":"PZ_026A_TRMOL_NIV_EST",
-},
-
-"P-027A": {
-"GASTO_(l.p.s.)":"PZ_027A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_027A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_027A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_027A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_027A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_027A_DR_CORR_L1",
-"AMP_L2":"PZ_027A_DR_CORR_L2",
-"AMP_L3":"PZ_027A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_027A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_027A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_027A_DR_NIV_EST",
-},
-
-"P-029A": {
-"GASTO_(l.p.s.)":"PZ_029A_TRJT_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_029A_TRJT_PRES_INS",
-"VOLTAJE_L1":"PZ_029A_TRJT_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_029A_TRJT_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_029A_TRJT_VOL_L1_L3",
-"AMP_L1":"PZ_029A_TRJT_CORR_L1",
-"AMP_L2":"PZ_029A_TRJT_CORR_L2",
-"AMP_L3":"PZ_029A_TRJT_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_029A_TRJT_LONG_COLUM",
-"SUMERGENCIA":"PZ_029A_TRJT_SUMERG",
-"NIVEL_DINAMICO":"PZ_029A_TRJT_NIV_EST",
-},
-
-"P-030": {
-"GASTO_(l.p.s.)":"PZ_030_TRC_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_030_TRC_PRES_INS",
-"VOLTAJE_L1":"PZ_030_TRC_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_030_TRC_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_030_TRC_VOL_L1_L3",
-"AMP_L1":"PZ_030_TRC_CORR_L1",
-"AMP_L2":"PZ_030_TRC_CORR_L2",
-"AMP_L3":"PZ_030_TRC_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_030_TRC_LONG_COLUM",
-"SUMERGENCIA":"PZ_030_TRC_SUMERG",
-"NIVEL_DINAMICO":"PZ_030_TRC_NIV_EST",
-},
-
-"P-031A": {
-"GASTO_(l.p.s.)":"PZ_031A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_031A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_031A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_031A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_031A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_031A_DR_CORR_L1",
-"AMP_L2":"PZ_031A_DR_CORR_L2",
-"AMP_L3":"PZ_031A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_031A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_031A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_031A_DR_NIV_EST",
-},
-
-"P-032B": {
-"GASTO_(l.p.s.)":"PZ_032B_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_032B_PRES_INS",
-"VOLTAJE_L1":"PZ_032B_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_032B_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_032B_VOL_L1_L3",
-"AMP_L1":"PZ_032B_CORR_L1",
-"AMP_L2":"PZ_032B_CORR_L2",
-"AMP_L3":"PZ_032B_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_032B_LONG_COLUM",
-"SUMERGENCIA":"PZ_032B_SUMERG",
-"NIVEL_DINAMICO":"PZ_032B_NIV_EST",
-},
-
-"P-033A": {
-"GASTO_(l.p.s.)":"PZ_033A_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_033A_PRES_INS",
-"VOLTAJE_L1":"PZ_033A_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_033A_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_033A_VOL_L1_L3",
-"AMP_L1":"PZ_033A_CORR_L1",
-"AMP_L2":"PZ_033A_CORR_L2",
-"AMP_L3":"PZ_033A_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_033A_LONG_COLUM",
-"SUMERGENCIA":"PZ_033A_SUMERG",
-"NIVEL_DINAMICO":"PZ_033A_NIV_EST",
-},
-
-"P-034": {
-"GASTO_(l.p.s.)":"PZ_034_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_034_PRES_INS",
-"VOLTAJE_L1":"PZ_034_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_034_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_034_VOL_L1_L3",
-"AMP_L1":"PZ_034_CORR_L1",
-"AMP_L2":"PZ_034_CORR_L2",
-"AMP_L3":"PZ_034_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_034_LONG_COLUM",
-"SUMERGENCIA":"PZ_034_SUMERG",
-"NIVEL_DINAMICO":"PZ_034_NIV_EST",
-},
-
-"P-035A": {
-"GASTO_(l.p.s.)":"PZ_035A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_035A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_035A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_035A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_035A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_035A_DR_CORR_L1",
-"AMP_L2":"PZ_035A_DR_CORR_L2",
-"AMP_L3":"PZ_035A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_035A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_035A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_035A_DR_NIV_EST",
-},
-
-"P-037": {
-"GASTO_(l.p.s.)":"PZ_037_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_037_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_037_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_037_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_037_DR_VOL_L1_L3",
-"AMP_L1":"PZ_037_DR_CORR_L1",
-"AMP_L2":"PZ_037_DR_CORR_L2",
-"AMP_L3":"PZ_037_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_037_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_037_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_037_DR_NIV_EST",
-},
-
-"P-038A": {
-"GASTO_(l.p.s.)":"PZ_038A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_038A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_038A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_038A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_038A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_038A_DR_CORR_L1",
-"AMP_L2":"PZ_038A_DR_CORR_L2",
-"AMP_L3":"PZ_038A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_038A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_038A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_038A_DR_NIV_EST",
-},
-
-"P-039": {
-"GASTO_(l.p.s.)":"PZ_039_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_039_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_039_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_039_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_039_DR_VOL_L1_L3",
-"AMP_L1":"PZ_039_DR_CORR_L1",
-"AMP_L2":"PZ_039_DR_CORR_L2",
-"AMP_L3":"PZ_039_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_039_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_039_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_039_DR_NIV_EST",
-},
-
-"P-040": {
-"GASTO_(l.p.s.)":"PZ_040_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_040_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_040_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_040_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_040_DR_VOL_L1_L3",
-"AMP_L1":"PZ_040_DR_CORR_L1",
-"AMP_L2":"PZ_040_DR_CORR_L2",
-"AMP_L3":"PZ_040_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_040_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_040_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_040_DR_NIV_EST",
-},
-
-"P-041": {
-"GASTO_(l.p.s.)":"PZ_041_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_041_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_041_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_041_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_041_DR_VOL_L1_L3",
-"AMP_L1":"PZ_041_DR_CORR_L1",
-"AMP_L2":"PZ_041_DR_CORR_L2",
-"AMP_L3":"PZ_041_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_041_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_041_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_041_DR_NIV_EST",
-},
-
-"P-043A": {
-"GASTO_(l.p.s.)":"PZ_043A_TRHDAS_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_043A_TRHDAS_PRES_INS",
-"VOLTAJE_L1":"PZ_043A_TRHDAS_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_043A_TRHDAS_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_043A_TRHDAS_VOL_L1_L3",
-"AMP_L1":"PZ_043A_TRHDAS_CORR_L1",
-"AMP_L2":"PZ_043A_TRHDAS_CORR_L2",
-"AMP_L3":"PZ_043A_TRHDAS_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_043A_TRHDAS_LONG_COLUM",
-"SUMERGENCIA":"PZ_043A_TRHDAS_SUMERG",
-"NIVEL_DINAMICO":"PZ_043A_TRHDAS_NIV_EST",
-},
-
-"P-044A": {
-"GASTO_(l.p.s.)":"PZ_044A_TRC_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_044A_TRC_PRES_INS",
-"VOLTAJE_L1":"PZ_044A_TRC_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_044A_TRC_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_044A_TRC_VOL_L1_L3",
-"AMP_L1":"PZ_044A_TRC_CORR_L1",
-"AMP_L2":"PZ_044A_TRC_CORR_L2",
-"AMP_L3":"PZ_044A_TRC_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_044A_TRC_LONG_COLUM",
-"SUMERGENCIA":"PZ_044A_TRC_SUMERG",
-"NIVEL_DINAMICO":"PZ_044A_TRC_NIV_EST",
-},
-
-"P-045": {
-"GASTO_(l.p.s.)":"TQ_P_045_CAU_INS1",
-"PRESION_(kg/cm2)":"TQ_P_045_PRES_INS1",
-"VOLTAJE_L1":"TQ_P_045_VOL_L1_L21",
-"VOLTAJE_L2":"TQ_P_045_VOL_L2_L31",
-"VOLTAJE_L3":"TQ_P_045_VOL_L1_L31",
-"AMP_L1":"TQ_P_045_CORR_L11",
-"AMP_L2":"TQ_P_045_CORR_L21",
-"AMP_L3":"TQ_P_045_CORR_L31",
-"LONGITUD_DE_COLUMNA":"PZ_045_TRC_LONG_COLUM",
-"SUMERGENCIA":"PZ_045_TRC_SUMERG",
-"NIVEL_DINAMICO":"PZ_045_TRC_NIV_EST",
-},
-
-"P-046A": {
-"GASTO_(l.p.s.)":"PZ_046A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_046A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_046A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_046A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_046A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_046A_DR_CORR_L1",
-"AMP_L2":"PZ_046A_DR_CORR_L2",
-"AMP_L3":"PZ_046A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_046A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_046A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_046A_DR_NIV_EST",
-},
-
-"P-047A": {
-"GASTO_(l.p.s.)":"PZ_047A_TRC_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_047A_TRC_PRES_INS",
-"VOLTAJE_L1":"PZ_047A_TRC_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_047A_TRC_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_047A_TRC_VOL_L1_L3",
-"AMP_L1":"PZ_047A_TRC_CORR_L1",
-"AMP_L2":"PZ_047A_TRC_CORR_L2",
-"AMP_L3":"PZ_047A_TRC_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_047A_TRC_LONG_COLUM",
-"SUMERGENCIA":"PZ_047A_TRC_SUMERG",
-"NIVEL_DINAMICO":"PZ_047A_TRC_NIV_EST",
-},
-
-"P-049": {
-"GASTO_(l.p.s.)":"PZ_049_TRSTEMA_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_049_TRSTEMA_PRES_INS",
-"VOLTAJE_L1":"PZ_049_TRSTEMA_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_049_TRSTEMA_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_049_TRSTEMA_VOL_L1_L3",
-"AMP_L1":"PZ_049_TRSTEMA_CORR_L1",
-"AMP_L2":"PZ_049_TRSTEMA_CORR_L2",
-"AMP_L3":"PZ_049_TRSTEMA_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_049_TRSTEMA_LONG_COLUM",
-"SUMERGENCIA":"PZ_049_TRSTEMA_SUMERG",
-"NIVEL_DINAMICO":"PZ_049_TRSTEMA_NIV_EST",
-},
-
-"P-050A": {
-"GASTO_(l.p.s.)":"PZ_050A_TRINS_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_050A_TRINS_PRES_INS",
-"VOLTAJE_L1":"PZ_050A_TRINS_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_050A_TRINS_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_050A_TRINS_VOL_L1_L3",
-"AMP_L1":"PZ_050A_TRINS_CORR_L1",
-"AMP_L2":"PZ_050A_TRINS_CORR_L2",
-"AMP_L3":"PZ_050A_TRINS_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_050A_TRINS_LONG_COLUM",
-"SUMERGENCIA":"PZ_050A_TRINS_SUMERG",
-"NIVEL_DINAMICO":"PZ_050A_TRINS_NIV_EST",
-},
-
-"P-051A": {
-"GASTO_(l.p.s.)":"PZ_051_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_051_PRES_INS",
-"VOLTAJE_L1":"PZ_051_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_051_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_051_VOL_L1_L3",
-"AMP_L1":"PZ_051_CORR_L1",
-"AMP_L2":"PZ_051_CORR_L2",
-"AMP_L3":"PZ_051_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_051_LONG_COLUM",
-"SUMERGENCIA":"PZ_051_SUMERG",
-"NIVEL_DINAMICO":"PZ_051_NIV_EST",
-},
-
-"P-053A": {
-"GASTO_(l.p.s.)":"PZ_053A_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_053A_PRES_INS",
-"VOLTAJE_L1":"PZ_053A_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_053A_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_053A_VOL_L1_L3",
-"AMP_L1":"PZ_053A_CORR_L1",
-"AMP_L2":"PZ_053A_CORR_L2",
-"AMP_L3":"PZ_053A_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_053A_LONG_COLUM",
-"SUMERGENCIA":"PZ_053A_SUMERG",
-"NIVEL_DINAMICO":"PZ_053A_NIV_EST",
-},
-
-"P-055": {
-"GASTO_(l.p.s.)":"PZ_055_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_055_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_055_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_055_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_055_DR_VOL_L1_L3",
-"AMP_L1":"PZ_055_DR_CORR_L1",
-"AMP_L2":"PZ_055_DR_CORR_L2",
-"AMP_L3":"PZ_055_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_055_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_055_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_055_DR_NIV_EST",
-},
-
-"P-056": {
-"GASTO_(l.p.s.)":"PZ_056_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_056_PRES_INS",
-"VOLTAJE_L1":"PZ_056_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_056_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_056_VOL_L1_L3",
-"AMP_L1":"PZ_056_CORR_L1",
-"AMP_L2":"PZ_056_CORR_L2",
-"AMP_L3":"PZ_056_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_056_LONG_COLUM",
-"SUMERGENCIA":"PZ_056_SUMERG",
-"NIVEL_DINAMICO":"PZ_056_NIV_EST",
-},
-
-"P-057": {
-"GASTO_(l.p.s.)":"PZ_057_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_057_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_057_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_057_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_057_DR_VOL_L1_L3",
-"AMP_L1":"PZ_057_DR_CORR_L1",
-"AMP_L2":"PZ_057_DR_CORR_L2",
-"AMP_L3":"PZ_057_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_057_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_057_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_057_DR_NIV_EST",
-},
-
-"P-059A": {
-"GASTO_(l.p.s.)":"PZ_059_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_059_PRES_INS",
-"VOLTAJE_L1":"PZ_059_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_059_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_059_VOL_L1_L3",
-"AMP_L1":"PZ_059_CORR_L1",
-"AMP_L2":"PZ_059_CORR_L2",
-"AMP_L3":"PZ_059_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_059_LONG_COLUM",
-"SUMERGENCIA":"PZ_059_SUMERG",
-"NIVEL_DINAMICO":"PZ_059_NIV_EST",
-},
-
-"P-060": {
-"GASTO_(l.p.s.)":"PZ_060_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_060_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_060_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_060_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_060_DR_VOL_L1_L3",
-"AMP_L1":"PZ_060_DR_CORR_L1",
-"AMP_L2":"PZ_060_DR_CORR_L2",
-"AMP_L3":"PZ_060_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_060_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_060_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_060_DR_NIV_EST",
-},
-
-"P-061": {
-"GASTO_(l.p.s.)":"PZ_061_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_061_PRES_INS",
-"VOLTAJE_L1":"PZ_061_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_061_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_061_VOL_L1_L3",
-"AMP_L1":"PZ_061_CORR_L1",
-"AMP_L2":"PZ_061_CORR_L2",
-"AMP_L3":"PZ_061_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_061_LONG_COLUM",
-"SUMERGENCIA":"PZ_061_SUMERG",
-"NIVEL_DINAMICO":"PZ_061_NIV_EST",
-},
-
-"P-062": {
-"GASTO_(l.p.s.)":"PZ_062_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_062_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_062_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_062_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_062_DR_VOL_L1_L3",
-"AMP_L1":"PZ_062_DR_CORR_L1",
-"AMP_L2":"PZ_062_DR_CORR_L2",
-"AMP_L3":"PZ_062_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_062_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_062_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_062_DR_NIV_EST",
-},
-
-"P-063A": {
-"GASTO_(l.p.s.)":"PZ_063A_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_063A_PRES_INS",
-"VOLTAJE_L1":"PZ_063A_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_063A_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_063A_VOL_L1_L3",
-"AMP_L1":"PZ_063A_CORR_L1",
-"AMP_L2":"PZ_063A_CORR_L2",
-"AMP_L3":"PZ_063A_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_063A_LONG_COLUM",
-"SUMERGENCIA":"PZ_063A_SUMERG",
-"NIVEL_DINAMICO":"PZ_063A_NIV_EST",
-},
-
-"P-064": {
-"GASTO_(l.p.s.)":"PZ_064_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_064_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_064_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_064_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_064_DR_VOL_L1_L3",
-"AMP_L1":"PZ_064_DR_CORR_L1",
-"AMP_L2":"PZ_064_DR_CORR_L2",
-"AMP_L3":"PZ_064_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_064_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_064_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_064_DR_NIV_EST",
-},
-
-"P-066": {
-"GASTO_(l.p.s.)":"PZ_066_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_066_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_066_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_066_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_066_DR_VOL_L1_L3",
-"AMP_L1":"PZ_066_DR_CORR_L1",
-"AMP_L2":"PZ_066_DR_CORR_L2",
-"AMP_L3":"PZ_066_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_066_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_066_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_066_DR_NIV_EST",
-},
-
-"P-067": {
-"GASTO_(l.p.s.)":"PZ_067_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_067_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_067_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_067_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_067_DR_VOL_L1_L3",
-"AMP_L1":"PZ_067_DR_CORR_L1",
-"AMP_L2":"PZ_067_DR_CORR_L2",
-"AMP_L3":"PZ_067_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_067_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_067_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_067_DR_NIV_EST",
-},
-
-"P-068": {
-"GASTO_(l.p.s.)":"PZ_RB_068_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_RB_068_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_RB_068_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_RB_068_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_RB_068_DR_VOL_L1_L3",
-"AMP_L1":"PZ_RB_068_DR_CORR_L1",
-"AMP_L2":"PZ_RB_068_DR_CORR_L2",
-"AMP_L3":"PZ_RB_068_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_RB_068_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_RB_068_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_RB_068_DR_NIV_EST",
-},
-
-"P-069A": {
-"GASTO_(l.p.s.)":"PZ_069A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_069A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_069A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_069A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_069A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_069A_DR_CORR_L1",
-"AMP_L2":"PZ_069A_DR_CORR_L2",
-"AMP_L3":"PZ_069A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_069A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_069A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_069A_DR_NIV_EST",
-},
-
-"P-069A": {
-"GASTO_(l.p.s.)":"PZ_070A_TRCANT_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_070A_TRCANT_PRES_INS",
-"VOLTAJE_L1":"PZ_070A_TRCANT_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_070A_TRCANT_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_070A_TRCANT_VOL_L1_L3",
-"AMP_L1":"PZ_070A_TRCANT_CORR_L1",
-"AMP_L2":"PZ_070A_TRCANT_CORR_L2",
-"AMP_L3":"PZ_070A_TRCANT_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_070A_TRCANT_LONG_COLUM",
-"SUMERGENCIA":"PZ_070A_TRCANT_SUMERG",
-"NIVEL_DINAMICO":"PZ_070A_TRCANT_NIV_EST",
-},
-
-"P-071": {
-"GASTO_(l.p.s.)":"PZ_071_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_071_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_071_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_071_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_071_DR_VOL_L1_L3",
-"AMP_L1":"PZ_071_DR_CORR_L1",
-"AMP_L2":"PZ_071_DR_CORR_L2",
-"AMP_L3":"PZ_071_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_071_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_071_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_071_DR_NIV_EST",
-},
-
-"P-072A": {
-"GASTO_(l.p.s.)":"PZ_072A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_072A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_072A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_072A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_072A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_072A_DR_CORR_L1",
-"AMP_L2":"PZ_072A_DR_CORR_L2",
-"AMP_L3":"PZ_072A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_072A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_072A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_072A_DR_NIV_EST",
-},
-
-"P-073": {
-"GASTO_(l.p.s.)":"PZ_073_TRC_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_073_TRC_PRES_INS",
-"VOLTAJE_L1":"PZ_073_TRC_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_073_TRC_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_073_TRC_VOL_L1_L3",
-"AMP_L1":"PZ_073_TRC_CORR_L1",
-"AMP_L2":"PZ_073_TRC_CORR_L2",
-"AMP_L3":"PZ_073_TRC_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_073_TRC_LONG_COLUM",
-"SUMERGENCIA":"PZ_073_TRC_SUMERG",
-"NIVEL_DINAMICO":"PZ_073_TRC_NIV_EST",
-},
-
-"P-075": {
-"GASTO_(l.p.s.)":"PZ_075_TRINS_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_075_TRINS_PRES_INS",
-"VOLTAJE_L1":"PZ_075_TRINS_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_075_TRINS_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_075_TRINS_VOL_L1_L3",
-"AMP_L1":"PZ_075_TRINS_CORR_L1",
-"AMP_L2":"PZ_075_TRINS_CORR_L2",
-"AMP_L3":"PZ_075_TRINS_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_075_TRINS_LONG_COLUM",
-"SUMERGENCIA":"PZ_075_TRINS_SUMERG",
-"NIVEL_DINAMICO":"PZ_075_TRINS_NIV_EST",
-},
-
-"P-076": {
-"GASTO_(l.p.s.)":"PZ_076_TRINS_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_076_TRINS_PRES_INS",
-"VOLTAJE_L1":"PZ_076_TRINS_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_076_TRINS_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_076_TRINS_VOL_L1_L3",
-"AMP_L1":"PZ_076_TRINS_CORR_L1",
-"AMP_L2":"PZ_076_TRINS_CORR_L2",
-"AMP_L3":"PZ_076_TRINS_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_076_TRINS_LONG_COLUM",
-"SUMERGENCIA":"PZ_076_TRINS_SUMERG",
-"NIVEL_DINAMICO":"PZ_076_TRINS_NIV_EST",
-},
-
-"P-077": {
-"GASTO_(l.p.s.)":"PZ_077_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_077_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_077_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_077_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_077_DR_VOL_L1_L3",
-"AMP_L1":"PZ_077_DR_CORR_L1",
-"AMP_L2":"PZ_077_DR_CORR_L2",
-"AMP_L3":"PZ_077_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_077_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_077_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_077_DR_NIV_EST",
-},
-
-"P-078A": {
-"GASTO_(l.p.s.)":"PZ_078A_TRMOL_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_078A_TRMOL_PRES_INS",
-"VOLTAJE_L1":"PZ_078A_TRMOL_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_078A_TRMOL_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_078A_TRMOL_VOL_L1_L3",
-"AMP_L1":"PZ_078A_TRMOL_CORR_L1",
-"AMP_L2":"PZ_078A_TRMOL_CORR_L2",
-"AMP_L3":"PZ_078A_TRMOL_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_078A_TRMOL_LONG_COLUM",
-"SUMERGENCIA":"PZ_078A_TRMOL_SUMERG",
-"NIVEL_DINAMICO":"PZ_078A_TRMOL_NIV_EST",
-},
-
-"P-079": {
-"GASTO_(l.p.s.)":"PZ_079_TREUC_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_079_TREUC_PRES_INS",
-"VOLTAJE_L1":"PZ_079_TREUC_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_079_TREUC_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_079_TREUC_VOL_L1_L3",
-"AMP_L1":"PZ_079_TREUC_CORR_L1",
-"AMP_L2":"PZ_079_TREUC_CORR_L2",
-"AMP_L3":"PZ_079_TREUC_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_079_TREUC_LONG_COLUM",
-"SUMERGENCIA":"PZ_079_TREUC_SUMERG",
-"NIVEL_DINAMICO":"PZ_079_TREUC_NIV_EST",
-},
-
-"P-080A": {
-"GASTO_(l.p.s.)":"PZ_080A_TRM_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_080A_TRM_PRES_INS",
-"VOLTAJE_L1":"PZ_080A_TRM_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_080A_TRM_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_080A_TRM_VOL_L1_L3",
-"AMP_L1":"PZ_080A_TRM_CORR_L1",
-"AMP_L2":"PZ_080A_TRM_CORR_L2",
-"AMP_L3":"PZ_080A_TRM_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_080A_TRM_LONG_COLUM",
-"SUMERGENCIA":"PZ_080A_TRM_SUMERG",
-"NIVEL_DINAMICO":"PZ_080A_TRM_NIV_EST",
-},
-
-"P-082": {
-"GASTO_(l.p.s.)":"PZ_082_TRINS_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_082_TRINS_PRES_INS",
-"VOLTAJE_L1":"PZ_082_TRINS_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_082_TRINS_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_082_TRINS_VOL_L1_L3",
-"AMP_L1":"PZ_082_TRINS_CORR_L1",
-"AMP_L2":"PZ_082_TRINS_CORR_L2",
-"AMP_L3":"PZ_082_TRINS_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_082_TRINS_LONG_COLUM",
-"SUMERGENCIA":"PZ_082_TRINS_SUMERG",
-"NIVEL_DINAMICO":"PZ_082_TRINS_NIV_EST",
-},
-
-"P-083A": {
-"GASTO_(l.p.s.)":"PZ_083A_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_083A_PRES_INS",
-"VOLTAJE_L1":"PZ_083A_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_083A_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_083A_VOL_L1_L3",
-"AMP_L1":"PZ_083A_CORR_L1",
-"AMP_L2":"PZ_083A_CORR_L2",
-"AMP_L3":"PZ_083A_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_083A_LONG_COLUM",
-"SUMERGENCIA":"PZ_083A_SUMERG",
-"NIVEL_DINAMICO":"PZ_083A_NIV_EST",
-},
-
-"P-084A": {
-"GASTO_(l.p.s.)":"PZ_084A_TRC_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_084A_TRC_PRES_INS",
-"VOLTAJE_L1":"PZ_084A_TRC_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_084A_TRC_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_084A_TRC_VOL_L1_L3",
-"AMP_L1":"PZ_084A_TRC_CORR_L1",
-"AMP_L2":"PZ_084A_TRC_CORR_L2",
-"AMP_L3":"PZ_084A_TRC_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_084A_TRC_LONG_COLUM",
-"SUMERGENCIA":"PZ_084A_TRC_SUMERG",
-"NIVEL_DINAMICO":"PZ_084A_TRC_NIV_EST",
-},
-
-"P-085": {
-"GASTO_(l.p.s.)":"PZ_085_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_085_PRES_INS",
-"VOLTAJE_L1":"PZ_085_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_085_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_085_VOL_L1_L3",
-"AMP_L1":"PZ_085_CORR_L1",
-"AMP_L2":"PZ_085_CORR_L2",
-"AMP_L3":"PZ_085_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_085_LONG_COLUM",
-"SUMERGENCIA":"PZ_085_SUMERG",
-"NIVEL_DINAMICO":"PZ_085_NIV_EST",
-},
-
-"P-086": {
-"GASTO_(l.p.s.)":"PZ_086_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_086_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_086_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_086_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_086_DR_VOL_L1_L3",
-"AMP_L1":"PZ_086_DR_CORR_L1",
-"AMP_L2":"PZ_086_DR_CORR_L2",
-"AMP_L3":"PZ_086_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_086_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_086_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_086_DR_NIV_EST",
-},
-
-"P-087": {
-"GASTO_(l.p.s.)":"PZ_087_LP_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_087_LP_PRES_INS",
-"VOLTAJE_L1":"PZ_087_LP_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_087_LP_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_087_LP_VOL_L1_L3",
-"AMP_L1":"PZ_087_LP_CORR_L1",
-"AMP_L2":"PZ_087_LP_CORR_L2",
-"AMP_L3":"PZ_087_LP_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_087_LP_LONG_COLUM",
-"SUMERGENCIA":"PZ_087_LP_SUMERG",
-"NIVEL_DINAMICO":"PZ_087_LP_NIV_EST",
-},
-
-"P-088": {
-"GASTO_(l.p.s.)":"PZ_088_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_088_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_088_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_088_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_088_DR_VOL_L1_L3",
-"AMP_L1":"PZ_088_DR_CORR_L1",
-"AMP_L2":"PZ_088_DR_CORR_L2",
-"AMP_L3":"PZ_088_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_088_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_088_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_088_DR_NIV_EST",
-},
-
-"P-089": {
-"GASTO_(l.p.s.)":"PZ_089_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_089_PRES_INS",
-"VOLTAJE_L1":"PZ_089_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_089_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_089_VOL_L1_L3",
-"AMP_L1":"PZ_089_CORR_L1",
-"AMP_L2":"PZ_089_CORR_L2",
-"AMP_L3":"PZ_089_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_089_LONG_COLUM",
-"SUMERGENCIA":"PZ_089_SUMERG",
-"NIVEL_DINAMICO":"PZ_089_NIV_EST",
-},
-
-"P-091A": {
-"GASTO_(l.p.s.)":"PZ_091A_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_091A_PRES_INS",
-"VOLTAJE_L1":"PZ_091A_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_091A_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_091A_VOL_L1_L3",
-"AMP_L1":"PZ_091A_CORR_L1",
-"AMP_L2":"PZ_091A_CORR_L2",
-"AMP_L3":"PZ_091A_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_091A_LONG_COLUM",
-"SUMERGENCIA":"PZ_091A_SUMERG",
-"NIVEL_DINAMICO":"PZ_091A_NIV_EST",
-},
-
-"P-092": {
-"GASTO_(l.p.s.)":"PZ_092_TRC_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_092_TRC_PRES_INS",
-"VOLTAJE_L1":"PZ_092_TRC_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_092_TRC_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_092_TRC_VOL_L1_L3",
-"AMP_L1":"PZ_092_TRC_CORR_L1",
-"AMP_L2":"PZ_092_TRC_CORR_L2",
-"AMP_L3":"PZ_092_TRC_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_092_TRC_LONG_COLUM",
-"SUMERGENCIA":"PZ_092_TRC_SUMERG",
-"NIVEL_DINAMICO":"PZ_092_TRC_NIV_EST",
-},
 
-"P-093": {
-"GASTO_(l.p.s.)":"PZ_093_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_093_PRES_INS",
-"VOLTAJE_L1":"PZ_093_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_093_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_093_VOL_L1_L3",
-"AMP_L1":"PZ_093_CORR_L1",
-"AMP_L2":"PZ_093_CORR_L2",
-"AMP_L3":"PZ_093_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_093_LONG_COLUM",
-"SUMERGENCIA":"PZ_093_SUMERG",
-"NIVEL_DINAMICO":"PZ_093_NIV_EST",
-},
+# --- 2. RECURSOS DEL PROCESO ---
+# st.cache_resource los crea una sola vez por proceso de Streamlit y los comparte entre sesiones
 
-"P-094A": {
-"GASTO_(l.p.s.)":"PZ_094A_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_094A_PRES_INS",
-"VOLTAJE_L1":"PZ_094A_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_094A_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_094A_VOL_L1_L3",
-"AMP_L1":"PZ_094A_CORR_L1",
-"AMP_L2":"PZ_094A_CORR_L2",
-"AMP_L3":"PZ_094A_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_094A_LONG_COLUM",
-"SUMERGENCIA":"PZ_094A_SUMERG",
-"NIVEL_DINAMICO":"PZ_094A_NIV_EST",
-},
+@st.cache_resource
+def registro_conexiones():
+    return crear_motores(DB_SCADA, DB_INFORME, DB_POSTGRES)
 
-"P-095": {
-"GASTO_(l.p.s.)":"PZ_095_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_095_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_095_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_095_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_095_DR_VOL_L1_L3",
-"AMP_L1":"PZ_095_DR_CORR_L1",
-"AMP_L2":"PZ_095_DR_CORR_L2",
-"AMP_L3":"PZ_095_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_095_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_095_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_095_DR_NIV_EST",
-},
+@st.cache_resource
+def recursos_sincronizacion():
+    return crear_recursos(DB_SCADA, DB_INFORME, DB_POSTGRES, motores=registro_conexiones())
 
-"P-096A": {
-"GASTO_(l.p.s.)":"PZ_096A_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_096A_PRES_INS",
-"VOLTAJE_L1":"PZ_096A_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_096A_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_096A_VOL_L1_L3",
-"AMP_L1":"PZ_096A_CORR_L1",
-"AMP_L2":"PZ_096A_CORR_L2",
-"AMP_L3":"PZ_096A_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_096A_LONG_COLUM",
-"SUMERGENCIA":"PZ_096A_SUMERG",
-"NIVEL_DINAMICO":"PZ_096A_NIV_EST",
-},
-
-"P-097A": {
-"GASTO_(l.p.s.)":"PZ_097A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_097A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_097A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_097A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_097A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_097A_DR_CORR_L1",
-"AMP_L2":"PZ_097A_DR_CORR_L2",
-"AMP_L3":"PZ_097A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_097A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_097A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_097A_DR_NIV_EST",
-},
-
-"P-098A": {
-"GASTO_(l.p.s.)":"PZ_098A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_098A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_098A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_098A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_098A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_098A_DR_CORR_L1",
-"AMP_L2":"PZ_098A_DR_CORR_L2",
-"AMP_L3":"PZ_098A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_098A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_098A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_098A_DR_NIV_EST",
-},
-
-"P-099A": {
-"GASTO_(l.p.s.)":"PZ_099A_TRM_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_099A_TRM_PRES_INS",
-"VOLTAJE_L1":"PZ_099A_TRM_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_099A_TRM_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_099A_TRM_VOL_L1_L3",
-"AMP_L1":"PZ_099A_TRM_CORR_L1",
-"AMP_L2":"PZ_099A_TRM_CORR_L2",
-"AMP_L3":"PZ_099A_TRM_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_099A_TRM_LONG_COLUM",
-"SUMERGENCIA":"PZ_099A_TRM_SUMERG",
-"NIVEL_DINAMICO":"PZ_099A_TRM_NIV_EST",
-},
-
-"P-100A": {
-"GASTO_(l.p.s.)":"PZ_100A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_100A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_100A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_100A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_100A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_100A_DR_CORR_L1",
-"AMP_L2":"PZ_100A_DR_CORR_L2",
-"AMP_L3":"PZ_100A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_100A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_100A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_100A_DR_NIV_EST",
-},
-
-"P-102A": {
-"GASTO_(l.p.s.)":"PZ_102A_TRCCAPAMA_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_102A_TRCCAPAMA_PRES_INS",
-"VOLTAJE_L1":"PZ_102A_TRCCAPAMA_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_102A_TRCCAPAMA_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_102A_TRCCAPAMA_VOL_L1_L3",
-"AMP_L1":"PZ_102A_TRCCAPAMA_CORR_L1",
-"AMP_L2":"PZ_102A_TRCCAPAMA_CORR_L2",
-"AMP_L3":"PZ_102A_TRCCAPAMA_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_102A_TRCCAPAMA_LONG_COLUM",
-"SUMERGENCIA":"PZ_102A_TRCCAPAMA_SUMERG",
-"NIVEL_DINAMICO":"PZ_102A_TRCCAPAMA_NIV_EST",
-},
-
-"P-105": {
-"GASTO_(l.p.s.)":"PZ_105_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_105_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_105_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_105_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_105_DR_VOL_L1_L3",
-"AMP_L1":"PZ_105_DR_CORR_L1",
-"AMP_L2":"PZ_105_DR_CORR_L2",
-"AMP_L3":"PZ_105_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_105_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_105_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_105_DR_NIV_EST",
-},
-
-"P-106": {
-"GASTO_(l.p.s.)":"PZ_106_TRCANT_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_106_TRCANT_PRES_INS",
-"VOLTAJE_L1":"PZ_106_TRCANT_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_106_TRCANT_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_106_TRCANT_VOL_L1_L3",
-"AMP_L1":"PZ_106_TRCANT_CORR_L1",
-"AMP_L2":"PZ_106_TRCANT_CORR_L2",
-"AMP_L3":"PZ_106_TRCANT_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_106_TRCANT_LONG_COLUM",
-"SUMERGENCIA":"PZ_106_TRCANT_SUMERG",
-"NIVEL_DINAMICO":"PZ_106_TRCANT_NIV_EST",
-},
-
-"P-106A": {
-"GASTO_(l.p.s.)":"PZ_106A_TRCANT_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_106A_TRCANT_PRES_INS",
-"VOLTAJE_L1":"PZ_106A_TRCANT_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_106A_TRCANT_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_106A_TRCANT_VOL_L1_L3",
-"AMP_L1":"PZ_106A_TRCANT_CORR_L1",
-"AMP_L2":"PZ_106A_TRCANT_CORR_L2",
-"AMP_L3":"PZ_106A_TRCANT_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_106A_TRCANT_LONG_COLUM",
-"SUMERGENCIA":"PZ_106A_TRCANT_SUMERG",
-"NIVEL_DINAMICO":"PZ_106A_TRCANT_NIV_EST",
-},
-
-"P-107": {
-"GASTO_(l.p.s.)":"PZ_107_TRCANT_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_107_TRCANT_PRES_INS",
-"VOLTAJE_L1":"PZ_107_TRCANT_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_107_TRCANT_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_107_TRCANT_VOL_L1_L3",
-"AMP_L1":"PZ_107_TRCANT_CORR_L1",
-"AMP_L2":"PZ_107_TRCANT_CORR_L2",
-"AMP_L3":"PZ_107_TRCANT_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_107_TRCANT_LONG_COLUM",
-"SUMERGENCIA":"PZ_107_TRCANT_SUMERG",
-"NIVEL_DINAMICO":"PZ_107_TRCANT_NIV_EST",
-},
-
-"P-108": {
-"GASTO_(l.p.s.)":"PZ_108_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_108_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_108_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_108_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_108_DR_VOL_L1_L3",
-"AMP_L1":"PZ_108_DR_CORR_L1",
-"AMP_L2":"PZ_108_DR_CORR_L2",
-"AMP_L3":"PZ_108_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_108_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_108_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_108_DR_NIV_EST",
-},
-
-"P-110A": {
-"GASTO_(l.p.s.)":"PZ_110A_TRINS_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_110A_TRINS_PRES_INS",
-"VOLTAJE_L1":"PZ_110A_TRINS_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_110A_TRINS_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_110A_TRINS_VOL_L1_L3",
-"AMP_L1":"PZ_110A_TRINS_CORR_L1",
-"AMP_L2":"PZ_110A_TRINS_CORR_L2",
-"AMP_L3":"PZ_110A_TRINS_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_110A_TRINS_LONG_COLUM",
-"SUMERGENCIA":"PZ_110A_TRINS_SUMERG",
-"NIVEL_DINAMICO":"PZ_110A_TRINS_NIV_EST",
-},
-
-"P-111A": {
-"GASTO_(l.p.s.)":"PZ_111A_TRMOL_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_111A_TRMOL_PRES_INS",
-"VOLTAJE_L1":"PZ_111A_TRMOL_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_111A_TRMOL_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_111A_TRMOL_VOL_L1_L3",
-"AMP_L1":"PZ_111A_TRMOL_CORR_L1",
-"AMP_L2":"PZ_111A_TRMOL_CORR_L2",
-"AMP_L3":"PZ_111A_TRMOL_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_111A_TRMOL_LONG_COLUM",
-"SUMERGENCIA":"PZ_111A_TRMOL_SUMERG",
-"NIVEL_DINAMICO":"PZ_111A_TRMOL_NIV_EST",
-},
-
-"P-113A": {
-"GASTO_(l.p.s.)":"PZ_113A_TRMOL_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_113A_TRMOL_PRES_INS",
-"VOLTAJE_L1":"PZ_113A_TRMOL_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_113A_TRMOL_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_113A_TRMOL_VOL_L1_L3",
-"AMP_L1":"PZ_113A_TRMOL_CORR_L1",
-"AMP_L2":"PZ_113A_TRMOL_CORR_L2",
-"AMP_L3":"PZ_113A_TRMOL_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_113A_TRMOL_LONG_COLUM",
-"SUMERGENCIA":"PZ_113A_TRMOL_SUMERG",
-"NIVEL_DINAMICO":"PZ_113A_TRMOL_NIV_EST",
-},
-
-"P-114": {
-"GASTO_(l.p.s.)":"PZ_114_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_114_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_114_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_114_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_114_DR_VOL_L1_L3",
-"AMP_L1":"PZ_114_DR_CORR_L1",
-"AMP_L2":"PZ_114_DR_CORR_L2",
-"AMP_L3":"PZ_114_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_114_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_114_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_114_DR_NIV_EST",
-},
-
-"P-115A": {
-"GASTO_(l.p.s.)":"PZ_115A_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_115A_PRES_INS",
-"VOLTAJE_L1":"PZ_115A_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_115A_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_115A_VOL_L1_L3",
-"AMP_L1":"PZ_115A_CORR_L1",
-"AMP_L2":"PZ_115A_CORR_L2",
-"AMP_L3":"PZ_115A_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_115A_LONG_COLUM",
-"SUMERGENCIA":"PZ_115A_SUMERG",
-"NIVEL_DINAMICO":"PZ_115A_NIV_EST",
-},
-
-"P-116A": {
-"GASTO_(l.p.s.)":"PZ_116A_TRJT_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_116A_TRJT_PRES_INS",
-"VOLTAJE_L1":"PZ_116A_TRJT_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_116A_TRJT_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_116A_TRJT_VOL_L1_L3",
-"AMP_L1":"PZ_116A_TRJT_CORR_L1",
-"AMP_L2":"PZ_116A_TRJT_CORR_L2",
-"AMP_L3":"PZ_116A_TRJT_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_116A_TRJT_LONG_COLUM",
-"SUMERGENCIA":"PZ_116A_TRJT_SUMERG",
-"NIVEL_DINAMICO":"PZ_116A_TRJT_NIV_EST",
-},
-
-"P-118A": {
-"GASTO_(l.p.s.)":"PZ_118A_TRVALLCAM_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_118A_TRVALLCAM_PRES_INS",
-"VOLTAJE_L1":"PZ_118A_TRVALLCAM_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_118A_TRVALLCAM_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_118A_TRVALLCAM_VOL_L1_L3",
-"AMP_L1":"PZ_118A_TRVALLCAM_CORR_L1",
-"AMP_L2":"PZ_118A_TRVALLCAM_CORR_L2",
-"AMP_L3":"PZ_118A_TRVALLCAM_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_118A_TRVALLCAM_LONG_COLUM",
-"SUMERGENCIA":"PZ_118A_TRVALLCAM_SUMERG",
-"NIVEL_DINAMICO":"PZ_118A_TRVALLCAM_NIV_EST",
-},
-
-"P-119A": {
-"GASTO_(l.p.s.)":"PZ_119A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_119A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_119A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_119A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_119A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_119A_DR_CORR_L1",
-"AMP_L2":"PZ_119A_DR_CORR_L2",
-"AMP_L3":"PZ_119A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_119A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_119A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_119A_DR_NIV_EST",
-},
-
-"P-120A": {
-"GASTO_(l.p.s.)":"PZ_120A_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_120A_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_120A_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_120A_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_120A_DR_VOL_L1_L3",
-"AMP_L1":"PZ_120A_DR_CORR_L1",
-"AMP_L2":"PZ_120A_DR_CORR_L2",
-"AMP_L3":"PZ_120A_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_120A_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_120A_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_120A_DR_NIV_EST",
-},
-
-"P-124": {
-"GASTO_(l.p.s.)":"PZ_124_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_124_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_124_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_124_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_124_DR_VOL_L1_L3",
-"AMP_L1":"PZ_124_DR_CORR_L1",
-"AMP_L2":"PZ_124_DR_CORR_L2",
-"AMP_L3":"PZ_124_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_124_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_124_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_124_DR_NIV_EST",
-},
-
-"P-125": {
-"GASTO_(l.p.s.)":"PZ_125_TRM_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_125_TRM_PRES_INS",
-"VOLTAJE_L1":"PZ_125_TRM_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_125_TRM_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_125_TRM_VOL_L1_L3",
-"AMP_L1":"PZ_125_TRM_CORR_L1",
-"AMP_L2":"PZ_125_TRM_CORR_L2",
-"AMP_L3":"PZ_125_TRM_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_125_TRM_LONG_COLUM",
-"SUMERGENCIA":"PZ_125_TRM_SUMERG",
-"NIVEL_DINAMICO":"PZ_125_TRM_NIV_EST",
-},
-
-"P-125A": {
-"GASTO_(l.p.s.)":"PZ_125A_TRMOL_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_125A_TRMOL_PRES_INS",
-"VOLTAJE_L1":"PZ_125A_TRMOL_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_125A_TRMOL_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_125A_TRMOL_VOL_L1_L3",
-"AMP_L1":"PZ_125A_TRMOL_CORR_L1",
-"AMP_L2":"PZ_125A_TRMOL_CORR_L2",
-"AMP_L3":"PZ_125A_TRMOL_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_125A_TRMOL_LONG_COLUM",
-"SUMERGENCIA":"PZ_125A_TRMOL_SUMERG",
-"NIVEL_DINAMICO":"PZ_125A_TRMOL_NIV_EST",
-},
-
-"P-126": {
-"GASTO_(l.p.s.)":"PZ_126_TRM_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_126_TRM_PRES_INS",
-"VOLTAJE_L1":"PZ_126_TRM_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_126_TRM_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_126_TRM_VOL_L1_L3",
-"AMP_L1":"PZ_126_TRM_CORR_L1",
-"AMP_L2":"PZ_126_TRM_CORR_L2",
-"AMP_L3":"PZ_126_TRM_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_126_TRM_LONG_COLUM",
-"SUMERGENCIA":"PZ_126_TRM_SUMERG",
-"NIVEL_DINAMICO":"PZ_126_TRM_NIV_EST",
-},
-
-"P-129": {
-"GASTO_(l.p.s.)":"PZ_129_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_129_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_129_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_129_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_129_DR_VOL_L1_L3",
-"AMP_L1":"PZ_129_DR_CORR_L1",
-"AMP_L2":"PZ_129_DR_CORR_L2",
-"AMP_L3":"PZ_129_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_129_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_129_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_129_DR_NIV_EST",
-},
-
-"P-130": {
-"GASTO_(l.p.s.)":"PZ_130_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_130_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_130_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_130_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_130_DR_VOL_L1_L3",
-"AMP_L1":"PZ_130_DR_CORR_L1",
-"AMP_L2":"PZ_130_DR_CORR_L2",
-"AMP_L3":"PZ_130_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_130_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_130_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_130_DR_NIV_EST",
-},
-
-"P-131": {
-"GASTO_(l.p.s.)":"PZ_131_TRM_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_131_TRM_PRES_INS",
-"VOLTAJE_L1":"PZ_131_TRM_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_131_TRM_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_131_TRM_VOL_L1_L3",
-"AMP_L1":"PZ_131_TRM_CORR_L1",
-"AMP_L2":"PZ_131_TRM_CORR_L2",
-"AMP_L3":"PZ_131_TRM_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_131_TRM_LONG_COLUM",
-"SUMERGENCIA":"PZ_131_TRM_SUMERG",
-"NIVEL_DINAMICO":"PZ_131_TRM_NIV_EST",
-},
-
-"P-132": {
-"GASTO_(l.p.s.)":"PZ_132_TRHDAS_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_132_TRHDAS_PRES_INS",
-"VOLTAJE_L1":"PZ_132_TRHDAS_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_132_TRHDAS_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_132_TRHDAS_VOL_L1_L3",
-"AMP_L1":"PZ_132_TRHDAS_CORR_L1",
-"AMP_L2":"PZ_132_TRHDAS_CORR_L2",
-"AMP_L3":"PZ_132_TRHDAS_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_132_TRHDAS_LONG_COLUM",
-"SUMERGENCIA":"PZ_132_TRHDAS_SUMERG",
-"NIVEL_DINAMICO":"PZ_132_TRHDAS_NIV_EST",
-},
-
-"P-134": {
-"GASTO_(l.p.s.)":"PZ_134_TRM_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_134_TRM_PRES_INS",
-"VOLTAJE_L1":"PZ_134_TRM_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_134_TRM_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_134_TRM_VOL_L1_L3",
-"AMP_L1":"PZ_134_TRM_CORR_L1",
-"AMP_L2":"PZ_134_TRM_CORR_L2",
-"AMP_L3":"PZ_134_TRM_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_134_TRM_LONG_COLUM",
-"SUMERGENCIA":"PZ_134_TRM_SUMERG",
-"NIVEL_DINAMICO":"PZ_134_TRM_NIV_EST",
-},
-
-"P-135A": {
-"GASTO_(l.p.s.)":"PZ_135A_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_135A_PRES_INS",
-"VOLTAJE_L1":"PZ_135A_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_135A_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_135A_VOL_L1_L3",
-"AMP_L1":"PZ_135A_CORR_L1",
-"AMP_L2":"PZ_135A_CORR_L2",
-"AMP_L3":"PZ_135A_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_135A_LONG_COLUM",
-"SUMERGENCIA":"PZ_135A_SUMERG",
-"NIVEL_DINAMICO":"PZ_135A_NIV_EST",
-},
-
-"P-136": {
-"GASTO_(l.p.s.)":"PZ_136_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_136_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_136_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_136_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_136_DR_VOL_L1_L3",
-"AMP_L1":"PZ_136_DR_CORR_L1",
-"AMP_L2":"PZ_136_DR_CORR_L2",
-"AMP_L3":"PZ_136_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_136_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_136_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_136_DR_NIV_EST",
-},
-
-"P-138": {
-"GASTO_(l.p.s.)":"PZ_138_TRHDAS_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_138_TRHDAS_PRES_INS",
-"VOLTAJE_L1":"PZ_138_TRHDAS_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_138_TRHDAS_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_138_TRHDAS_VOL_L1_L3",
-"AMP_L1":"PZ_138_TRHDAS_CORR_L1",
-"AMP_L2":"PZ_138_TRHDAS_CORR_L2",
-"AMP_L3":"PZ_138_TRHDAS_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_138_TRHDAS_LONG_COLUM",
-"SUMERGENCIA":"PZ_138_TRHDAS_SUMERG",
-"NIVEL_DINAMICO":"PZ_138_TRHDAS_NIV_EST",
-},
-
-"P-139": {
-"GASTO_(l.p.s.)":"PZ_139_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_139_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_139_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_139_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_139_DR_VOL_L1_L3",
-"AMP_L1":"PZ_139_DR_CORR_L1",
-"AMP_L2":"PZ_139_DR_CORR_L2",
-"AMP_L3":"PZ_139_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_139_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_139_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_139_DR_NIV_EST",
-},
-
-"P-140": {
-"GASTO_(l.p.s.)":"PZ_140_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_140_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_140_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_140_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_140_DR_VOL_L1_L3",
-"AMP_L1":"PZ_140_DR_CORR_L1",
-"AMP_L2":"PZ_140_DR_CORR_L2",
-"AMP_L3":"PZ_140_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_140_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_140_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_140_DR_NIV_EST",
-},
-
-"P-142": {
-"GASTO_(l.p.s.)":"PZ_142_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_142_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_142_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_142_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_142_DR_VOL_L1_L3",
-"AMP_L1":"PZ_142_DR_CORR_L1",
-"AMP_L2":"PZ_142_DR_CORR_L2",
-"AMP_L3":"PZ_142_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_142_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_142_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_142_DR_NIV_EST",
-},
-
-"P-143": {
-"GASTO_(l.p.s.)":"PZ_143_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_143_PRES_INS",
-"VOLTAJE_L1":"PZ_143_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_143_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_143_VOL_L1_L3",
-"AMP_L1":"PZ_143_CORR_L1",
-"AMP_L2":"PZ_143_CORR_L2",
-"AMP_L3":"PZ_143_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_143_LONG_COLUM",
-"SUMERGENCIA":"PZ_143_SUMERG",
-"NIVEL_DINAMICO":"PZ_143_NIV_EST",
-},
-
-"P-144": {
-"GASTO_(l.p.s.)":"PZ_144_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_144_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_144_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_144_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_144_DR_VOL_L1_L3",
-"AMP_L1":"PZ_144_DR_CORR_L1",
-"AMP_L2":"PZ_144_DR_CORR_L2",
-"AMP_L3":"PZ_144_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_144_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_144_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_144_DR_NIV_EST",
-},
-
-"P-145": {
-"GASTO_(l.p.s.)":"PZ_145_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_145_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_145_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_145_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_145_DR_VOL_L1_L3",
-"AMP_L1":"PZ_145_DR_CORR_L1",
-"AMP_L2":"PZ_145_DR_CORR_L2",
-"AMP_L3":"PZ_145_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_145_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_145_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_145_DR_NIV_EST",
-},
-
-"P-147": {
-"GASTO_(l.p.s.)":"PZ_147_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_147_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_147_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_147_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_147_DR_VOL_L1_L3",
-"AMP_L1":"PZ_147_DR_CORR_L1",
-"AMP_L2":"PZ_147_DR_CORR_L2",
-"AMP_L3":"PZ_147_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_147_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_147_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_147_DR_NIV_EST",
-},
-
-"P-150": {
-"GASTO_(l.p.s.)":"PZ_150_TRHDAS_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_150_TRHDAS_PRES_INS",
-"VOLTAJE_L1":"PZ_150_TRHDAS_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_150_TRHDAS_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_150_TRHDAS_VOL_L1_L3",
-"AMP_L1":"PZ_150_TRHDAS_CORR_L1",
-"AMP_L2":"PZ_150_TRHDAS_CORR_L2",
-"AMP_L3":"PZ_150_TRHDAS_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_150_TRHDAS_LONG_COLUM",
-"SUMERGENCIA":"PZ_150_TRHDAS_SUMERG",
-"NIVEL_DINAMICO":"PZ_150_TRHDAS_NIV_EST",
-},
-
-"P-151": {
-"GASTO_(l.p.s.)":"PZ_151_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_151_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_151_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_151_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_151_DR_VOL_L1_L3",
-"AMP_L1":"PZ_151_DR_CORR_L1",
-"AMP_L2":"PZ_151_DR_CORR_L2",
-"AMP_L3":"PZ_151_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_151_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_151_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_151_DR_NIV_EST",
-},
-
-"P-152": {
-"GASTO_(l.p.s.)":"PZ_152_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_152_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_152_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_152_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_152_DR_VOL_L1_L3",
-"AMP_L1":"PZ_152_DR_CORR_L1",
-"AMP_L2":"PZ_152_DR_CORR_L2",
-"AMP_L3":"PZ_152_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_152_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_152_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_152_DR_NIV_EST",
-},
-
-"P-153": {
-"GASTO_(l.p.s.)":"PZ_153_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_153_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_153_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_153_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_153_DR_VOL_L1_L3",
-"AMP_L1":"PZ_153_DR_CORR_L1",
-"AMP_L2":"PZ_153_DR_CORR_L2",
-"AMP_L3":"PZ_153_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_153_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_153_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_153_DR_NIV_EST",
-},
-
-"P-156": {
-"GASTO_(l.p.s.)":"PZ_156_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_156_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_156_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_156_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_156_DR_VOL_L1_L3",
-"AMP_L1":"PZ_156_DR_CORR_L1",
-"AMP_L2":"PZ_156_DR_CORR_L2",
-"AMP_L3":"PZ_156_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_156_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_156_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_156_DR_NIV_EST",
-},
-
-"P-157": {
-"GASTO_(l.p.s.)":"PZ_157_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_157_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_157_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_157_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_157_DR_VOL_L1_L3",
-"AMP_L1":"PZ_157_DR_CORR_L1",
-"AMP_L2":"PZ_157_DR_CORR_L2",
-"AMP_L3":"PZ_157_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_157_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_157_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_157_DR_NIV_EST",
-},
-
-"P-158": {
-"GASTO_(l.p.s.)":"PZ_158_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_158_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_158_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_158_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_158_DR_VOL_L1_L3",
-"AMP_L1":"PZ_158_DR_CORR_L1",
-"AMP_L2":"PZ_158_DR_CORR_L2",
-"AMP_L3":"PZ_158_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_158_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_158_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_158_DR_NIV_EST",
-},
-
-"P-159": {
-"GASTO_(l.p.s.)":"PZ_159_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_159_PRES_INS",
-"VOLTAJE_L1":"PZ_159_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_159_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_159_VOL_L1_L3",
-"AMP_L1":"PZ_159_CORR_L1",
-"AMP_L2":"PZ_159_CORR_L2",
-"AMP_L3":"PZ_159_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_159_LONG_COLUM",
-"SUMERGENCIA":"PZ_159_SUMERG",
-"NIVEL_DINAMICO":"PZ_159_NIV_EST",
-},
-
-"P-161": {
-"GASTO_(l.p.s.)":"PZ_161_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_161_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_161_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_161_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_161_DR_VOL_L1_L3",
-"AMP_L1":"PZ_161_DR_CORR_L1",
-"AMP_L2":"PZ_161_DR_CORR_L2",
-"AMP_L3":"PZ_161_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_161_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_161_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_161_DR_NIV_EST",
-},
-
-"P-162": {
-"GASTO_(l.p.s.)":"PZ_TQ_162_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_TQ_162_PRES_INS",
-"VOLTAJE_L1":"PZ_TQ_162_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_TQ_162_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_TQ_162_VOL_L1_L3",
-"AMP_L1":"PZ_TQ_162_CORR_L1",
-"AMP_L2":"PZ_TQ_162_CORR_L2",
-"AMP_L3":"PZ_TQ_162_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_TQ_162_LONG_COLUM",
-"SUMERGENCIA":"PZ_TQ_162_SUMERG",
-"NIVEL_DINAMICO":"PZ_TQ_162_NIV_EST",
-},
-
-"P-163": {
-"GASTO_(l.p.s.)":"PZ_163_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_163_PRES_INS",
-"VOLTAJE_L1":"PZ_163_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_163_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_163_VOL_L1_L3",
-"AMP_L1":"PZ_163_CORR_L1",
-"AMP_L2":"PZ_163_CORR_L2",
-"AMP_L3":"PZ_163_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_163_LONG_COLUM",
-"SUMERGENCIA":"PZ_163_SUMERG",
-"NIVEL_DINAMICO":"PZ_163_NIV_EST",
-},
-
-"P-165": {
-"GASTO_(l.p.s.)":"PZ_165_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_165_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_165_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_165_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_165_DR_VOL_L1_L3",
-"AMP_L1":"PZ_165_DR_CORR_L1",
-"AMP_L2":"PZ_165_DR_CORR_L2",
-"AMP_L3":"PZ_165_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_165_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_165_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_165_DR_NIV_EST",
-},
-
-"P-": {
-"GASTO_(l.p.s.)":"PZ_167_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_167_PRES_INS",
-"VOLTAJE_L1":"PZ_167_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_167_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_167_VOL_L1_L3",
-"AMP_L1":"PZ_167_CORR_L1",
-"AMP_L2":"PZ_167_CORR_L2",
-"AMP_L3":"PZ_167_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_167_LONG_COLUM",
-"SUMERGENCIA":"PZ_167_SUMERG",
-"NIVEL_DINAMICO":"PZ_167_NIV_EST",
-},
-
-"P-169": {
-"GASTO_(l.p.s.)":"TQ_T_169_DR_CAU_INS1",
-"PRESION_(kg/cm2)":"PZ_SNGER_PRES_R",
-"VOLTAJE_L1":"PZ_SNGER_V_L1",
-"VOLTAJE_L2":"PZ_SNGER_V_L2",
-"VOLTAJE_L3":"PZ_SNGER_V_L3",
-"AMP_L1":"PZ_SNGER_I_L1",
-"AMP_L2":"PZ_SNGER_I_L2",
-"AMP_L3":"PZ_SNGER_I_L3",
-},
-
-"P-170": {
-"GASTO_(l.p.s.)":"PZ_170_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_170_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_170_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_170_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_170_DR_VOL_L1_L3",
-"AMP_L1":"PZ_170_DR_CORR_L1",
-"AMP_L2":"PZ_170_DR_CORR_L2",
-"AMP_L3":"PZ_170_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_170_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_170_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_170_DR_NIV_EST",
-},
-
-"P-171": {
-"GASTO_(l.p.s.)":"PZ_171_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_171_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_171_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_171_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_171_DR_VOL_L1_L3",
-"AMP_L1":"PZ_171_DR_CORR_L1",
-"AMP_L2":"PZ_171_DR_CORR_L2",
-"AMP_L3":"PZ_171_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_171_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_171_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_171_DR_NIV_EST",
-},
-
-"P-173": {
-"GASTO_(l.p.s.)":"PZ_173_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_173_PRES_INS",
-"VOLTAJE_L1":"PZ_173_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_173_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_173_VOL_L1_L3",
-"AMP_L1":"PZ_173_CORR_L1",
-"AMP_L2":"PZ_173_CORR_L2",
-"AMP_L3":"PZ_173_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_173_LONG_COLUM",
-"SUMERGENCIA":"PZ_173_SUMERG",
-"NIVEL_DINAMICO":"PZ_173_NIV_EST",
-},
-
-"P-175": {
-"GASTO_(l.p.s.)":"PZ_175_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_175_PRES_INS",
-"VOLTAJE_L1":"PZ_175_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_175_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_175_VOL_L1_L3",
-"AMP_L1":"PZ_175_CORR_L1",
-"AMP_L2":"PZ_175_CORR_L2",
-"AMP_L3":"PZ_175_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_175_LONG_COLUM",
-"SUMERGENCIA":"PZ_175_SUMERG",
-"NIVEL_DINAMICO":"PZ_175_NIV_EST",
-},
-
-"P-177": {
-"GASTO_(l.p.s.)":"PZ_177_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_177_PRES_INS",
-"VOLTAJE_L1":"PZ_177_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_177_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_177_VOL_L1_L3",
-"AMP_L1":"PZ_177_CORR_L1",
-"AMP_L2":"PZ_177_CORR_L2",
-"AMP_L3":"PZ_177_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_177_LONG_COLUM",
-"SUMERGENCIA":"PZ_177_SUMERG",
-"NIVEL_DINAMICO":"PZ_177_NIV_EST",
-},
-
-"P-178": {
-"GASTO_(l.p.s.)":"PZ_178_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_178_PRES_INS",
-"VOLTAJE_L1":"PZ_178_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_178_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_178_VOL_L1_L3",
-"AMP_L1":"PZ_178_CORR_L1",
-"AMP_L2":"PZ_178_CORR_L2",
-"AMP_L3":"PZ_178_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_178_LONG_COLUM",
-"SUMERGENCIA":"PZ_178_SUMERG",
-"NIVEL_DINAMICO":"PZ_178_NIV_EST",
-},
-
-"P-181": {
-"GASTO_(l.p.s.)":"PZ_181_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_181_PRES_INS",
-"VOLTAJE_L1":"PZ_181_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_181_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_181_VOL_L1_L3",
-"AMP_L1":"PZ_181_CORR_L1",
-"AMP_L2":"PZ_181_CORR_L2",
-"AMP_L3":"PZ_181_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_181_LONG_COLUM",
-"SUMERGENCIA":"PZ_181_SUMERG",
-"NIVEL_DINAMICO":"PZ_181_NIV_EST",
-},
-
-"P-182": {
-"GASTO_(l.p.s.)":"PZ_182_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_182_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_182_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_182_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_182_DR_VOL_L1_L3",
-"AMP_L1":"PZ_182_DR_CORR_L1",
-"AMP_L2":"PZ_182_DR_CORR_L2",
-"AMP_L3":"PZ_182_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_182_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_182_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_182_DR_NIV_EST",
-},
-
-"P-183A": {
-"GASTO_(l.p.s.)":"PZ_183A_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_183A_PRES_INS",
-"VOLTAJE_L1":"PZ_183A_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_183A_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_183A_VOL_L1_L3",
-"AMP_L1":"PZ_183A_CORR_L1",
-"AMP_L2":"PZ_183A_CORR_L2",
-"AMP_L3":"PZ_183A_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_183A_LONG_COLUM",
-"SUMERGENCIA":"PZ_183A_SUMERG",
-"NIVEL_DINAMICO":"PZ_183A_NIV_EST",
-},
-
-"P-195": {
-"GASTO_(l.p.s.)":"PZ_195_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_195_PRES_INS",
-"VOLTAJE_L1":"PZ_195_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_195_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_195_VOL_L1_L3",
-"AMP_L1":"PZ_195_CORR_L1",
-"AMP_L2":"PZ_195_CORR_L2",
-"AMP_L3":"PZ_195_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_195_LONG_COLUM",
-"SUMERGENCIA":"PZ_195_SUMERG",
-"NIVEL_DINAMICO":"PZ_195_NIV_EST",
-},
-
-"R-020B": {
-"GASTO_(l.p.s.)":"PZ_RB_020B_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_RB_020B_PRES_INS",
-"VOLTAJE_L1":"PZ_RB_020B_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_RB_020B_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_RB_020B_VOL_L1_L3",
-"AMP_L1":"PZ_RB_020B_CORR_L1",
-"AMP_L2":"PZ_RB_020B_CORR_L2",
-"AMP_L3":"PZ_RB_020B_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_RB_020B_LONG_COLUM",
-"SUMERGENCIA":"PZ_RB_020B_SUMERG",
-"NIVEL_DINAMICO":"PZ_RB_020B_NIV_EST",
-},
-
-"R-024A": {
-"GASTO_(l.p.s.)":"PZ_R24_CAL_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_R24_CAL_PRES_INS",
-"VOLTAJE_L1":"PZ_R24_CAL_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_R24_CAL_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_R24_CAL_VOL_L1_L3",
-"AMP_L1":"PZ_R24_CAL_CORR_L1",
-"AMP_L2":"PZ_R24_CAL_CORR_L2",
-"AMP_L3":"PZ_R24_CAL_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_R24_CAL_LONG_COLUM",
-"SUMERGENCIA":"PZ_R24_CAL_SUMERG",
-"NIVEL_DINAMICO":"PZ_R24_CAL_NIV_EST",
-},
-
-"R-086": {
-"GASTO_(l.p.s.)":"PZ_025_DR_CAU_INS",
-"PRESION_(kg/cm2)":"PZ_025_DR_PRES_INS",
-"VOLTAJE_L1":"PZ_025_DR_VOL_L1_L2",
-"VOLTAJE_L2":"PZ_025_DR_VOL_L2_L3",
-"VOLTAJE_L3":"PZ_025_DR_VOL_L1_L3",
-"AMP_L1":"PZ_025_DR_CORR_L1",
-"AMP_L2":"PZ_025_DR_CORR_L2",
-"AMP_L3":"PZ_025_DR_CORR_L3",
-"LONGITUD_DE_COLUMNA":"PZ_025_DR_LONG_COLUM",
-"SUMERGENCIA":"PZ_025_DR_SUMERG",
-"NIVEL_DINAMICO":"PZ_025_DR_NIV_EST",
-},
-
-}
-
-# --- 2. LÓGICA DE PROCESAMIENTO ---
-
-def ejecutar_sincronizacion_total():
-    start_time = time.time() # Iniciar conteo de tiempo
-    st.session_state.last_logs = [] 
-    logs = []
-    progreso_bar = st.progress(0, text="Preparando sincronización... 0%")
-    status_text = st.empty()
-    filas_pg = 0
-    
-    try:
-        # 1. Lectura Google Sheets
-        progreso_bar.progress(10, text="Leyendo Google Sheets... 10%")
-        df = pd.read_csv(CSV_URL)
-        df.columns = [col.strip().replace('\n', ' ') for col in df.columns]
-        
-        if 'POZOS' not in df.columns:
-            return [f"❌ Error: No se encontró la columna 'POZOS'. Verifique el Excel."]
-
-        if 'FECHA_ACTUALIZACION' in df.columns:
-            df['FECHA_ACTUALIZACION'] = pd.to_datetime(df['FECHA_ACTUALIZACION'], errors='coerce')
-        
-        logs.append(f"✅ Google Sheets: {len(df)} registros leídos.")
-        progreso_bar.progress(25, text="Procesando datos del Excel... 25%")
-
-        # 2. SCADA
-        progreso_bar.progress(40, text="Consultando Base de Datos SCADA... 40%")
-        conn_s = mysql.connector.connect(**DB_SCADA)
-        all_tags = []
-        for p_id in MAPEO_SCADA: all_tags.extend(MAPEO_SCADA[p_id].values())
-        
-        query = f"SELECT r.NAME, h.VALUE FROM vfitagnumhistory h JOIN VfiTagRef r ON h.GATEID = r.GATEID WHERE r.NAME IN ({','.join(['%s']*len(all_tags))}) AND h.FECHA >= NOW() - INTERVAL 1 DAY ORDER BY h.FECHA DESC"
-        df_scada = pd.read_sql(query, conn_s, params=all_tags).drop_duplicates('NAME')
-        
-        for p_id, config in MAPEO_SCADA.items():
-            for col_excel, tag_name in config.items():
-                val = df_scada.loc[df_scada['NAME'] == tag_name, 'VALUE']
-                if not val.empty and col_excel in df.columns:
-                    df.loc[df['POZOS'] == p_id, col_excel] = round(float(val.values[0]), 2)
-        conn_s.close()
-        logs.append("🧬 SCADA: Valores inyectados correctamente.")
-        progreso_bar.progress(60, text="Inyectando datos a MySQL... 60%")
-
-        # 3. MySQL (Tabla INFORME)
-        progreso_bar.progress(70, text="Actualizando tabla INFORME... 70%")
-        p_my = urllib.parse.quote_plus(DB_INFORME['password'])
-        eng_my = create_engine(f"mysql+mysqlconnector://{DB_INFORME['user']}:{p_my}@{DB_INFORME['host']}/{DB_INFORME['database']}")
-        with eng_my.begin() as conn:
-            conn.execute(text("TRUNCATE TABLE INFORME"))
-            df_sql = df.replace({np.nan: None, pd.NaT: None})
-            df_sql.to_sql('INFORME', con=conn, if_exists='append', index=False)
-        logs.append("✅ MySQL: Tabla INFORME actualizada.")
-        progreso_bar.progress(85, text="Sincronizando con QGIS (Postgres)... 85%")
-
-        # 4. Postgres (QGIS)
-        p_pg = urllib.parse.quote_plus(DB_POSTGRES['pass'])
-        eng_pg = create_engine(f"postgresql://{DB_POSTGRES['user']}:{p_pg}@{DB_POSTGRES['host']}:{DB_POSTGRES['port']}/{DB_POSTGRES['db']}")
-        
-        with eng_pg.begin() as conn:
-            for _, row in df.iterrows():
-                id_val = str(row['ID']).strip() if pd.notnull(row['ID']) else None
-                if id_val and id_val != "nan":
-                    params = {'id': id_val}
-                    sets = []
-                    for csv_col, pg_col in MAPEO_POSTGRES.items():
-                        if csv_col in df.columns:
-                            val = row[csv_col]
-                            if pd.isna(val) or str(val).lower() == 'nan':
-                                clean_val = None
-                            elif pg_col == '_Ultima_actualizacion':
-                                clean_val = val.to_pydatetime() if hasattr(val, 'to_pydatetime') else val
-                            elif isinstance(val, str):
-                                s_val = val.replace(',', '')
-                                try: clean_val = float(s_val)
-                                except: clean_val = val
-                            else:
-                                clean_val = val
-                                
-                            params[pg_col] = clean_val
-                            sets.append(f'"{pg_col}" = :{pg_col}')
-                    
-                    if sets:
-                        res = conn.execute(text(f'UPDATE public."Pozos" SET {", ".join(sets)} WHERE "ID" = :id'), params)
-                        filas_pg += res.rowcount
-        
-        # --- CÁLCULO DE DURACIÓN ---
-        end_time = time.time()
-        duracion = round(end_time - start_time, 2)
-        
-        logs.append(f"🐘 Postgres: Tabla POZOS actualizada ({filas_pg} filas).")
-        logs.append(f"⏱️ DURACIÓN DEL PROCESO: {duracion} segundos.")
-        logs.append(f"🚀 SINCRO EXITOSA: {datetime.datetime.now(zona_local).strftime('%H:%M:%S')}")
-        
-        progreso_bar.progress(100, text="Sincronización finalizada al 100%")
-        time.sleep(1)
-        status_text.empty()
-        return logs
-    except Exception as e:
-        return [f"❌ Error crítico: {str(e)}"]
+@st.cache_resource
+def obtener_planificador():
+    return Planificador(recursos_sincronizacion())
 
 # --- 3. INTERFAZ ---
 
-def reset_console():
-    st.session_state.last_logs = ["SISTEMA EN ESPERA (Configuración actualizada)..."]
+plan = obtener_planificador()
+cfg_actual, _ = plan.instantanea()
+
+def aplicar_configuracion():
+    plan.configurar(modo=st.session_state.modo, hora=st.session_state.h_in, minuto=st.session_state.m_in)
 
 st.title("🖥️ MIAA Control Center")
 
 with st.container(border=True):
     c1, c2, c3, c4, c5 = st.columns([1.5, 1, 1, 1.5, 1.5])
-    with c1: modo = st.selectbox("Modo", ["Diario", "Periódico"], index=0, on_change=reset_console)
-    with c2: h_in = st.number_input("Hora", 0, 23, value=0, on_change=reset_console)
-    with c3: m_in = st.number_input("Min/Int", 0, 59, value=0, on_change=reset_console)
+    modos = ["Diario", "Periódico"]
+    with c1: st.selectbox("Modo", modos, index=modos.index(cfg_actual['modo']), key="modo", on_change=aplicar_configuracion)
+    with c2: st.number_input("Hora", 0, 23, value=cfg_actual['hora'], key="h_in", on_change=aplicar_configuracion)
+    with c3: st.number_input("Min/Int", 0, 59, value=cfg_actual['minuto'], key="m_in", on_change=aplicar_configuracion)
     with c4:
-        if "running" not in st.session_state: st.session_state.running = False
-        btn_label = "🛑 PARAR" if st.session_state.running else "▶️ INICIAR"
+        btn_label = "🛑 PARAR" if cfg_actual['activo'] else "▶️ INICIAR"
         if st.button(btn_label, use_container_width=True):
-            st.session_state.running = not st.session_state.running
+            plan.configurar(activo=not cfg_actual['activo'], modo=st.session_state.modo, hora=st.session_state.h_in, minuto=st.session_state.m_in)
             st.rerun()
     with c5:
         if st.button("🚀 FORZAR CARGA", use_container_width=True):
-            st.session_state.last_logs = ejecutar_sincronizacion_total()
-
-# Mostrar la consola
-log_txt = "<br>".join(st.session_state.get('last_logs', ["SISTEMA EN ESPERA..."]))
-st.markdown(f'<div style="background-color:black;color:#00FF00;padding:15px;font-family:Consolas;height:250px;overflow-y:auto;border-radius:5px;line-height:1.6;">{log_txt}</div>', unsafe_allow_html=True)
+            plan.forzar()
 
 # --- 4. RELOJ DE EJECUCIÓN ---
-if st.session_state.running:
-    ahora = datetime.datetime.now(zona_local)
-    if modo == "Diario":
-        prox = ahora.replace(hour=h_in, minute=m_in, second=0, microsecond=0)
-        if ahora >= prox: prox += datetime.timedelta(days=1)
-    else:
-        # Modo Periódico (m_in como intervalo)
-        intervalo = m_in if m_in > 0 else 1
-        total_m = ahora.hour * 60 + ahora.minute
-        sig = ((total_m // intervalo) + 1) * intervalo
-        prox = ahora.replace(hour=0, minute=0, second=0, microsecond=0) + datetime.timedelta(minutes=sig)
-
-    diff = prox - ahora
-    st.metric("⏳ PRÓXIMA CARGA EN:", str(diff).split('.')[0])
-    
-    if diff.total_seconds() <= 1:
-        st.session_state.last_logs = ejecutar_sincronizacion_total()
-        st.rerun()
-    
-    time.sleep(1)
-    st.rerun()
-
-
-
-
-
-
+# Sólo este fragmento se refresca cada segundo: lee el estado publicado por el planificador
+@st.fragment(run_every=1)
+def panel_estado():
+    cfg, estado = plan.instantanea()
+    if cfg['activo'] and estado['proxima'] is not None:
+        diff = max(estado['proxima'] - datetime.datetime.now(zona_local), datetime.timedelta(0))
+        st.metric("⏳ PRÓXIMA CARGA EN:", str(diff).split('.')[0])
+    if estado['ejecutando']:
+        st.progress(estado['progreso'], text=estado['texto'] or "Sincronizando...")
+
+    # Mostrar la consola
+    log_txt = "<br>".join(estado['logs'] or ["SINCRONIZANDO..."])
+    st.markdown(f'<div style="background-color:black;color:#00FF00;padding:15px;font-family:Consolas;height:250px;overflow-y:auto;border-radius:5px;line-height:1.6;">{log_txt}</div>', unsafe_allow_html=True)
+
+panel_estado()
+
+with st.expander("📈 Tiempos por etapa"):
+    # El contenido de un expander corre en cada rerun aunque esté cerrado: historial y pandas sólo a pedido
+    if st.toggle("Mostrar tiempos", key="ver_tiempos"):
+        import pandas as pd
+        historial = leer_historial()
+        if historial:
+            st.caption(f"Últimas {len(historial)} ejecuciones (segundos)")
+            st.dataframe(percentiles_etapas(historial), use_container_width=True)
+            serie = pd.DataFrame([{etapa: datos['s'] for etapa, datos in reg.get('etapas', {}).items()} for reg in historial])
+            st.line_chart(serie)
+        else:
+            st.caption("Sin ejecuciones registradas.")
+
+with st.expander("🩺 Conexiones"):
+    probar = st.button("Probar conexiones")
+    for nombre, info in salud_conexiones(registro_conexiones(), ping=probar).items():
+        st.text(f"{nombre}: {info['pool']}" + (f" | ping {info['ping']}" if 'ping' in info else ""))
+
+# Costo de este rerun (sin contar el fragmento de cada segundo) contra el presupuesto
+ms_rerun = round((time.perf_counter() - t_rerun) * 1000)
+st.caption(f"{'⚙️' if ms_rerun <= PRESUPUESTO_RERUN_MS else '⚠️'} Rerun: {ms_rerun} ms (presupuesto {PRESUPUESTO_RERUN_MS} ms)")
@@ -0,0 +1,190 @@
+import argparse
+import datetime
+import http.server
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+
+import generador_datos
+import sincronizacion as sync
+from mapeo_scada import POZOS
+
+# Banco de pruebas fuera de línea para las etapas de ejecutar_sincronizacion_total.
+#
+#   python benchmark_sync.py --pozos 150,1000,5000 --muestras 1,10 --cambio 0.01,0.1
+#   python benchmark_sync.py --mysql-url mysql+mysqlconnector://root:pw@127.0.0.1/bench \
+#                            --pg-url postgresql://postgres:pw@127.0.0.1/bench --salida bench.json
+#
+# Los datos salen de generador_datos (flota real replicada, histórico irregular).
+# Sin URLs se miden sólo las etapas en memoria (parseo del sheet, último valor por tag, inyección,
+# payload de Postgres, detección de cambios). Con URLs de un MySQL/Postgres local se recrean
+# vfitagnumhistory/VfiTagRef/INFORME/"Pozos" con los cargadores masivos del generador, el CSV se
+# sirve por HTTP en localhost y se corre la sincronización completa dos veces (en frío y tras
+# aplicar la tasa de cambio y el índice único de migraciones/, para medir el upsert diferencial).
+# El resultado es una lista JSON con una fila por (escenario, modo, etapa): segundos y pico de memoria.
+
+POZOS_DEFECTO = [150, 500, 1000, 5000]
+MUESTRAS_DEFECTO = [1, 10]
+CAMBIO_DEFECTO = [0.01, 0.1, 1.0]
+
+
+def datos_sinteticos(n_pozos, muestras, semilla=0):
+    # Flota real replicada hasta n_pozos; "muestras" es el promedio de muestras por tag en la ventana
+    registro = generador_datos.generar_flota(-(-n_pozos // len(POZOS)), n_pozos)
+    ref = generador_datos.generar_ref(registro)
+    sheet = generador_datos.generar_sheet(registro, semilla)
+    historia = generador_datos.generar_historia(registro, ref, sync.SCADA_VENTANA_HORAS,
+                                                muestras / sync.SCADA_VENTANA_HORAS, semilla)
+    return registro, sheet, ref, pd.concat(historia, ignore_index=True)
+
+
+def aplicar_cambios(sheet, historia, tasa, semilla=1):
+    # Mueve la telemetría de una fracción "tasa" de pozos/tags: nuevas filas de sheet y muestras nuevas
+    rng = np.random.default_rng(semilla)
+    sheet = sheet.copy()
+    filas = rng.random(len(sheet)) < tasa
+    sheet.loc[filas, 'GASTO_(l.p.s.)'] = (sheet.loc[filas, 'GASTO_(l.p.s.)'].fillna(0) + rng.uniform(1, 5, filas.sum())).round(2)
+    gateids = historia['GATEID'].unique()
+    movidos = gateids[rng.random(len(gateids)) < tasa]
+    nuevas = pd.DataFrame({'GATEID': movidos, 'VALUE': rng.uniform(0, 100, len(movidos)).round(3),
+                           'FECHA': pd.Timestamp.now().floor('s')})
+    return sheet, nuevas
+
+
+def medir(funcion):
+    tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    resultado = funcion()
+    segundos = time.perf_counter() - t0
+    pico = tracemalloc.get_traced_memory()[1]
+    return resultado, round(segundos, 4), round(pico / 1e6, 2)
+
+
+def bench_memoria(n_pozos, muestras, cambio, semilla):
+    registro, sheet, ref, historia = datos_sinteticos(n_pozos, muestras, semilla)
+    payload_csv = sheet.to_csv(index=False).encode('utf-8')
+    filas = []
+
+    def fila(etapa, s, pico, **extra):
+        filas.append(dict(extra, pozos=n_pozos, muestras=muestras, cambio=cambio, modo='memoria',
+                          etapa=etapa, s=s, pico_mb=pico))
+
+    df, s, pico = medir(lambda: sync.parsear_sheet(payload_csv))
+    fila('sheet_parseo', s, pico, bytes=len(payload_csv))
+    # Mismo plegado por bloques de SCADA_CHUNK que la lectura en streaming, más el cruce con VfiTagRef
+    bloques = lambda: (historia.iloc[i:i + sync.SCADA_CHUNK] for i in range(0, len(historia), sync.SCADA_CHUNK))
+    ultimos, s, pico = medir(lambda: sync.plegar_ultimos(bloques()).merge(ref, on='GATEID'))
+    fila('scada_ultimo', s, pico, filas_in=len(historia), bloques=-(-len(historia) // sync.SCADA_CHUNK))
+    n, s, pico = medir(lambda: sync.inyectar_valores_scada(df, ultimos[['NAME', 'VALUE']], registro.tabla))
+    fila('inyeccion', s, pico, filas_out=n)
+    payload, s, pico = medir(lambda: sync.payload_pozos(df))
+    fila('payload_pg', s, pico, filas_out=len(payload))
+
+    df_cambiado, _ = aplicar_cambios(df, historia, cambio, semilla + 1)
+    previo = payload.set_index('ID').astype(object)
+    (_, mascara), s, pico = medir(lambda: sync.celdas_cambiadas(sync.payload_pozos(df_cambiado), previo))
+    fila('cambios_pg', s, pico, filas_out=int(mascara.any(axis=1).sum()))
+    cambios, s, pico = medir(lambda: sync.filas_modificadas(sync.normalizar_informe(df_cambiado), sync.normalizar_informe(df)))
+    fila('cambios_informe', s, pico, filas_out=len(cambios))
+    return filas
+
+
+class _ServidorCSV(http.server.BaseHTTPRequestHandler):
+    payload = b''
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('Content-Length', str(len(self.payload)))
+        self.end_headers()
+        self.wfile.write(self.payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def bench_bases(n_pozos, muestras, cambio, semilla, mysql_url, pg_url):
+    registro, sheet, ref, historia = datos_sinteticos(n_pozos, muestras, semilla)
+    # Cada escenario arranca sin marcas de agua ni caché de sheet de la flota anterior
+    sync.CACHE_DIR = tempfile.mkdtemp(prefix='miaa-bench-')
+    sync.HISTORIAL_ARCHIVO = os.path.join(sync.CACHE_DIR, 'historial_sync.jsonl')
+    datos = os.path.join(sync.CACHE_DIR, 'datos')
+    generador_datos.escribir_csv(datos, sheet, ref, [historia])
+    generador_datos.cargar_mysql(mysql_url, datos)
+    generador_datos.cargar_postgres(pg_url, sheet)
+    eng_my = create_engine(mysql_url, **sync.POOL_OPCIONES)
+    eng_pg = create_engine(pg_url, **sync.POOL_OPCIONES)
+
+    servidor = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _ServidorCSV)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{servidor.server_address[1]}/informe.csv"
+    motores = {'scada': eng_my, 'informe': eng_my, 'postgres': eng_pg}
+    recursos = sync.crear_recursos(None, None, None, csv_url=url, registro=registro, motores=motores)
+
+    filas = []
+    try:
+        for corrida in ('frio', 'cambios'):
+            if corrida == 'cambios':
+                # La primera corrida creó INFORME; con la migración aplicada el ciclo siguiente va por upsert
+                generador_datos.aplicar_clave_informe(eng_my)
+                sheet, nuevas = aplicar_cambios(sheet, historia, cambio, semilla + 1)
+                nuevas.to_sql('vfitagnumhistory', eng_my, if_exists='append', index=False, method='multi', chunksize=5000)
+            _ServidorCSV.payload = sheet.to_csv(index=False).encode('utf-8')
+            logs, s, pico = medir(lambda: sync.ejecutar_sincronizacion_total(recursos))
+            registro_corrida = sync.leer_historial(1)[-1]
+            base = dict(pozos=n_pozos, muestras=muestras, cambio=cambio, modo=f"bd_{corrida}")
+            for etapa, datos in registro_corrida['etapas'].items():
+                filas.append(dict(base, etapa=etapa, **datos))
+            filas.append(dict(base, etapa='total', s=round(s, 4), pico_mb=pico, resultado=registro_corrida['resultado'],
+                              informe_ruta=recursos['informe']['ruta'],
+                              errores=[l for l in logs if l.startswith("❌")]))
+    finally:
+        servidor.shutdown()
+        eng_my.dispose()
+        eng_pg.dispose()
+    return filas
+
+
+def _lista(valor, tipo):
+    return [tipo(v) for v in valor.split(',') if v.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark fuera de línea de la sincronización MIAA")
+    parser.add_argument('--pozos', type=lambda v: _lista(v, int), default=POZOS_DEFECTO)
+    parser.add_argument('--muestras', type=lambda v: _lista(v, int), default=MUESTRAS_DEFECTO)
+    parser.add_argument('--cambio', type=lambda v: _lista(v, float), default=CAMBIO_DEFECTO)
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--mysql-url', help="MySQL local para SCADA e INFORME (se recrean las tablas)")
+    parser.add_argument('--pg-url', help='Postgres local para "Pozos" (se recrea la tabla)')
+    parser.add_argument('--salida', help="Archivo JSON de resultados (por omisión, stdout)")
+    args = parser.parse_args(argv)
+
+    tracemalloc.start()
+    resultados = []
+    for n_pozos in args.pozos:
+        for muestras in args.muestras:
+            for cambio in args.cambio:
+                resultados.extend(bench_memoria(n_pozos, muestras, cambio, args.semilla))
+                if args.mysql_url and args.pg_url:
+                    resultados.extend(bench_bases(n_pozos, muestras, cambio, args.semilla, args.mysql_url, args.pg_url))
+                print(f"{datetime.datetime.now():%H:%M:%S} pozos={n_pozos} muestras={muestras} cambio={cambio}", file=sys.stderr)
+    tracemalloc.stop()
+
+    salida = json.dumps(resultados, ensure_ascii=False, indent=1, default=str)
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f: f.write(salida)
+    else:
+        print(salida)
+
+
+if __name__ == '__main__':
+    main()
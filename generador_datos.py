@@ -0,0 +1,233 @@
+import argparse
+import io
+import os
+import re
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+from mapeo_scada import EXCEPCIONES, POZOS, SUFIJOS, RegistroScada
+from sincronizacion import ESQUEMA_SHEET, INFORME_CLAVE, INFORME_TABLA, MAPEO_POSTGRES, POOL_OPCIONES, clave_informe_indexada
+
+# Generador determinista de datos sintéticos con el esquema de MAPEO_SCADA.
+#
+#   python generador_datos.py --escala 10 --horas 24 --muestras-hora 12 --salida datos/
+#   python generador_datos.py --escala 10 --mysql-url mysql+mysqlconnector://root:pw@127.0.0.1/bench \
+#                             --pg-url postgresql://postgres:pw@127.0.0.1/bench
+#
+# Escala 1 reproduce la flota real (mismos pozos, prefijos y excepciones); la réplica k agrega a cada
+# pozo el número k delante ("P-002" → "P-3002") y a cada tag un segmento _R<k> antes del sufijo
+# ("PZ_002_TRC_R3_CAU_INS"). Con la misma semilla, escala y "ahora" la salida es idéntica.
+# El histórico es irregular: cada tag muestrea como proceso de Poisson, hay tags caídos (sin
+# muestras), huecos de varias horas y tags estancados cuya última muestra quedó fuera de la ventana.
+
+# Rango típico (mín, máx) de cada señal para los valores base por tag
+RANGOS = {
+    "GASTO_(l.p.s.)":      (5, 80),
+    "PRESION_(kg/cm2)":    (0.5, 6),
+    "VOLTAJE_L1":          (430, 470),
+    "VOLTAJE_L2":          (430, 470),
+    "VOLTAJE_L3":          (430, 470),
+    "AMP_L1":              (20, 120),
+    "AMP_L2":              (20, 120),
+    "AMP_L3":              (20, 120),
+    "LONGITUD_DE_COLUMNA": (80, 300),
+    "SUMERGENCIA":         (5, 80),
+    "NIVEL_DINAMICO":      (60, 250),
+}
+
+GATEID_BASE = 10000
+TAGS_POR_BLOQUE = 5000
+PROB_CAIDO = 0.03
+PROB_ESTANCADO = 0.05
+PROB_HUECO = 0.10
+HUECO_HORAS = 3
+
+
+def generar_flota(escala=1, n_pozos=None):
+    # Registro de la flota real repetida "escala" veces; n_pozos recorta a los primeros n
+    pozos, excepciones = list(POZOS), dict(EXCEPCIONES)
+    for k in range(1, escala):
+        for pozo, prefijo in POZOS:
+            replica = re.sub(r'^([A-Z]+)-', rf'\g<1>-{k}', pozo)
+            pozos.append((replica, f"{prefijo}_R{k}" if prefijo else None))
+            if pozo in EXCEPCIONES:
+                excepciones[replica] = {col: f"R{k}_{tag}" if tag else None for col, tag in EXCEPCIONES[pozo].items()}
+    if n_pozos is not None:
+        pozos = pozos[:n_pozos]
+        nombres = {pozo for pozo, _ in pozos}
+        excepciones = {pozo: config for pozo, config in excepciones.items() if pozo in nombres}
+    return RegistroScada(pozos, SUFIJOS, excepciones)
+
+
+def generar_ref(registro):
+    # VfiTagRef: un GATEID entero por tag, en el orden del registro
+    return pd.DataFrame({'GATEID': np.arange(GATEID_BASE, GATEID_BASE + len(registro.tags)), 'NAME': list(registro.tags)})
+
+
+def generar_sheet(registro, semilla=0, ahora=None):
+    # Sheet "informe" como lo exporta Google Sheets: texto, miles con coma y columnas SCADA con valores viejos
+    rng = np.random.default_rng([semilla, 0])
+    ahora = pd.Timestamp(ahora or pd.Timestamp.now().floor('h'))
+    pozos = list(registro.mapeo)
+    n = len(pozos)
+    sheet = pd.DataFrame({'POZOS': pozos, 'ID': [str(100 + i) for i in range(n)]})
+    for col, tipo in ESQUEMA_SHEET.items():
+        if col in sheet.columns:
+            continue
+        if col in RANGOS:
+            bajo, alto = RANGOS[col]
+            valores = pd.Series(rng.uniform(bajo, alto, n).round(2))
+            sheet[col] = valores.where(rng.random(n) > 0.2)
+        elif tipo == 'numero':
+            valores = pd.Series(rng.uniform(0, 50000 if 'EXTRACCION' in col else 300, n).round(2))
+            sheet[col] = valores.map('{:,.2f}'.format).where(rng.random(n) > 0.05)
+        elif tipo == 'fecha':
+            sheet[col] = (ahora - pd.to_timedelta(rng.integers(0, 86400 * 60, n), unit='s')).strftime('%Y-%m-%d %H:%M:%S')
+        elif col == 'ESTATUS':
+            sheet[col] = rng.choice(['ACTIVO', 'INACTIVO', 'MANTENIMIENTO'], n, p=[0.8, 0.15, 0.05])
+        elif col == 'TELEMETRIA':
+            sheet[col] = rng.choice(['SI', 'NO'], n, p=[0.9, 0.1])
+        else:
+            sheet[col] = [f"{col[:3]}-{v}" for v in rng.integers(1, 12, n)]
+    return sheet
+
+
+def generar_historia(registro, ref, horas=24, muestras_hora=12, semilla=0, ahora=None, tags_por_bloque=TAGS_POR_BLOQUE):
+    # vfitagnumhistory por bloques de tags (memoria acotada); cada bloque usa su propia semilla derivada
+    ahora = pd.Timestamp(ahora or pd.Timestamp.now().floor('h'))
+    ventana_s = horas * 3600
+    columnas = np.array(registro.columnas)
+    for inicio in range(0, len(ref), tags_por_bloque):
+        rng = np.random.default_rng([semilla, 1, inicio])
+        gateids = ref['GATEID'].values[inicio:inicio + tags_por_bloque]
+        cols = columnas[inicio:inicio + tags_por_bloque]
+        n = len(gateids)
+        conteos = rng.poisson(horas * muestras_hora, n)
+        caidos = rng.random(n) < PROB_CAIDO
+        estancados = ~caidos & (rng.random(n) < PROB_ESTANCADO)
+        conteos[caidos] = 0
+        conteos[estancados] = rng.integers(1, 4, estancados.sum())
+
+        tag = np.repeat(np.arange(n), conteos)
+        # Segundos hacia atrás desde "ahora"; los estancados quedan entre 1 y 3 ventanas atrás
+        atras = rng.uniform(0, ventana_s, len(tag))
+        atras[estancados[tag]] += rng.uniform(ventana_s, 2 * ventana_s, estancados[tag].sum())
+        # Huecos: una racha de HUECO_HORAS sin muestras en una fracción de los tags
+        hueco_ini = np.where(rng.random(n) < PROB_HUECO, rng.uniform(0, ventana_s, n), -np.inf)
+        en_hueco = (atras >= hueco_ini[tag]) & (atras < hueco_ini[tag] + HUECO_HORAS * 3600)
+
+        bajo = np.array([RANGOS.get(c, (0, 100))[0] for c in cols])
+        alto = np.array([RANGOS.get(c, (0, 100))[1] for c in cols])
+        base = rng.uniform(bajo, alto)
+        ruido = rng.normal(0, 0.02, len(tag)) * (alto - bajo)[tag]
+        bloque = pd.DataFrame({
+            'GATEID': gateids[tag],
+            'VALUE': np.clip(base[tag] + ruido, 0, None).round(3),
+            'FECHA': ahora - pd.to_timedelta(atras.round(), unit='s'),
+        })[~en_hueco]
+        yield bloque.sort_values('FECHA', kind='stable').reset_index(drop=True)
+
+
+def escribir_csv(salida, sheet, ref, historia):
+    # Archivos planos listos para LOAD DATA / COPY; la historia se escribe bloque a bloque
+    os.makedirs(salida, exist_ok=True)
+    sheet.to_csv(os.path.join(salida, 'informe.csv'), index=False)
+    ref.to_csv(os.path.join(salida, 'vfitagref.csv'), index=False)
+    ruta = os.path.join(salida, 'vfitagnumhistory.csv')
+    filas = 0
+    with open(ruta, 'w', encoding='utf-8', newline='') as f:
+        for i, bloque in enumerate(historia):
+            bloque.to_csv(f, index=False, header=(i == 0), date_format='%Y-%m-%d %H:%M:%S')
+            filas += len(bloque)
+    return filas
+
+
+def crear_tablas_mysql(eng):
+    with eng.begin() as conn:
+        for tabla in ('vfitagnumhistory', 'VfiTagRef', 'INFORME', 'INFORME_new', 'INFORME_old'):
+            conn.execute(text(f"DROP TABLE IF EXISTS {tabla}"))
+        conn.execute(text("CREATE TABLE VfiTagRef (GATEID INT PRIMARY KEY, NAME VARCHAR(80) NOT NULL, UNIQUE KEY (NAME))"))
+        conn.execute(text("CREATE TABLE vfitagnumhistory (GATEID INT NOT NULL, VALUE DOUBLE, FECHA DATETIME NOT NULL, KEY ix_gate_fecha (GATEID, FECHA))"))
+
+
+def aplicar_clave_informe(eng):
+    # migraciones/001_informe_clave_unica.sql sobre el INFORME que dejó la primera carga (POZOS como
+    # TEXT de pandas pasa a VARCHAR); sin él cada ciclo cae en la recarga completa y no se mide el upsert
+    if clave_informe_indexada(eng):
+        return False
+    with eng.begin() as conn:
+        conn.execute(text(f"ALTER TABLE {INFORME_TABLA} MODIFY {INFORME_CLAVE} VARCHAR(100) NOT NULL, "
+                          f"ADD UNIQUE INDEX ux_informe_clave ({INFORME_CLAVE})"))
+    return True
+
+
+def _load_data(eng, tabla, ruta, columnas):
+    conn = eng.raw_connection()
+    try:
+        cur = conn.cursor()
+        cur.execute(f"LOAD DATA LOCAL INFILE %s INTO TABLE {tabla} FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+                    f"IGNORE 1 LINES ({', '.join(columnas)})", (os.path.abspath(ruta),))
+        conn.commit()
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
+def cargar_mysql(mysql_url, salida):
+    # Tablas SCADA recreadas y cargadas con LOAD DATA LOCAL INFILE desde los CSV de escribir_csv
+    eng = create_engine(mysql_url, connect_args={'allow_local_infile': True}, **POOL_OPCIONES)
+    try:
+        crear_tablas_mysql(eng)
+        _load_data(eng, 'VfiTagRef', os.path.join(salida, 'vfitagref.csv'), ['GATEID', 'NAME'])
+        return _load_data(eng, 'vfitagnumhistory', os.path.join(salida, 'vfitagnumhistory.csv'), ['GATEID', 'VALUE', 'FECHA'])
+    finally:
+        eng.dispose()
+
+
+def cargar_postgres(pg_url, sheet):
+    # public."Pozos" recreada con las columnas de MAPEO_POSTGRES y sólo los ID cargados por COPY
+    tipos = {'numero': 'double precision', 'fecha': 'timestamp'}
+    columnas = ', '.join(f'"{pg_col}" {tipos.get(ESQUEMA_SHEET.get(csv_col), "text")}' for csv_col, pg_col in MAPEO_POSTGRES.items())
+    eng = create_engine(pg_url, **POOL_OPCIONES)
+    conn = eng.raw_connection()
+    try:
+        cur = conn.cursor()
+        cur.execute('DROP TABLE IF EXISTS public."Pozos"')
+        cur.execute(f'CREATE TABLE public."Pozos" ("ID" text PRIMARY KEY, {columnas})')
+        buffer = io.StringIO('\n'.join(sheet['ID'].astype(str)) + '\n')
+        cur.copy_expert('COPY public."Pozos" ("ID") FROM STDIN', buffer)
+        conn.commit()
+        return len(sheet)
+    finally:
+        conn.close()
+        eng.dispose()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Datos sintéticos de flota e histórico SCADA")
+    parser.add_argument('--escala', type=int, default=1, help="Réplicas de la flota real (1 = 1,603 tags)")
+    parser.add_argument('--horas', type=int, default=24)
+    parser.add_argument('--muestras-hora', type=float, default=12)
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--ahora', help="Fin de la ventana (YYYY-MM-DD HH:MM); por omisión la hora actual")
+    parser.add_argument('--salida', default='datos_sinteticos')
+    parser.add_argument('--mysql-url', help="MySQL donde recrear VfiTagRef/vfitagnumhistory")
+    parser.add_argument('--pg-url', help='Postgres donde recrear public."Pozos"')
+    args = parser.parse_args(argv)
+
+    registro = generar_flota(args.escala)
+    ref = generar_ref(registro)
+    sheet = generar_sheet(registro, args.semilla, args.ahora)
+    historia = generar_historia(registro, ref, args.horas, args.muestras_hora, args.semilla, args.ahora)
+    filas = escribir_csv(args.salida, sheet, ref, historia)
+    print(f"{len(registro.mapeo)} pozos, {len(ref)} tags, {filas} muestras → {args.salida}")
+    if args.mysql_url:
+        print(f"MySQL: {cargar_mysql(args.mysql_url, args.salida)} muestras cargadas")
+    if args.pg_url:
+        print(f"Postgres: {cargar_postgres(args.pg_url, sheet)} pozos cargados")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+import re
+from functools import cached_property
+
+# Registro de tags SCADA por pozo.
+# Casi todos los pozos siguen la convención <prefijo>_<sufijo>, así que la fuente declarativa es
+# un prefijo por pozo + la tabla de sufijos por señal; los pozos que se salen de la convención
+# declaran sus tags en EXCEPCIONES (un valor None quita la columna). El registro se compila una
+# sola vez por proceso al importar el módulo y falla en voz alta ante duplicados o colisiones.
+
+SUFIJOS = {
+    "GASTO_(l.p.s.)":      "CAU_INS",
+    "PRESION_(kg/cm2)":    "PRES_INS",
+    "VOLTAJE_L1":          "VOL_L1_L2",
+    "VOLTAJE_L2":          "VOL_L2_L3",
+    "VOLTAJE_L3":          "VOL_L1_L3",
+    "AMP_L1":              "CORR_L1",
+    "AMP_L2":              "CORR_L2",
+    "AMP_L3":              "CORR_L3",
+    "LONGITUD_DE_COLUMNA": "LONG_COLUM",
+    "SUMERGENCIA":         "SUMERG",
+    "NIVEL_DINAMICO":      "NIV_EST",
+}
+
+# (pozo, prefijo de tag); None = sin prefijo, todos sus tags están en EXCEPCIONES
+POZOS = [
+    ("P-002", "PZ_002_TRC"),
+    ("P-003", "PZ_003"),
+    ("P-004", "PZ_004"),
+    ("P-005A", "PZ_RP_005_TRHDAS"),
+    ("P-006", "PZ_006_TRC"),
+    ("P-008", "PZ_008"),
+    ("P-009", "PZ_009_TRJT"),
+    ("P-011", "PZ_011_TRJT"),
+    ("P-012", "PZ_TQ_012"),
+    ("P-013", "PZ_013"),
+    ("P-014A", "PZ_022A_DR"),
+    ("P-015", "PZ_015"),
+    ("P-016", "PZ_016_DR"),
+    ("P-017A", "PZ_017A_DR"),
+    ("P-018", "PZ_018"),
+    ("P-020A", "PZ_020A_TRMOL"),
+    ("P-021A", "PZ_021A_DR"),
+    ("P-022A", "PZ_022AV2"),
+    ("P-023A", "PZ_023A_DR"),
+    ("P-024", "PZ_024_TRC"),
+    ("P-025A", "PZ_025A"),
+    ("P-026A", "PZ_026A_TRMOL"),
+    ("P-027A", "PZ_027A_DR"),
+    ("P-029A", "PZ_029A_TRJT"),
+    ("P-030", "PZ_030_TRC"),
+    ("P-031A", "PZ_031A_DR"),
+    ("P-032B", "PZ_032B"),
+    ("P-033A", "PZ_033A"),
+    ("P-034", "PZ_034"),
+    ("P-035A", "PZ_035A_DR"),
+    ("P-037", "PZ_037_DR"),
+    ("P-038A", "PZ_038A_DR"),
+    ("P-039", "PZ_039_DR"),
+    ("P-040", "PZ_040_DR"),
+    ("P-041", "PZ_041_DR"),
+    ("P-043A", "PZ_043A_TRHDAS"),
+    ("P-044A", "PZ_044A_TRC"),
+    ("P-045", "PZ_045_TRC"),
+    ("P-046A", "PZ_046A_DR"),
+    ("P-047A", "PZ_047A_TRC"),
+    ("P-049", "PZ_049_TRSTEMA"),
+    ("P-050A", "PZ_050A_TRINS"),
+    ("P-051A", "PZ_051"),
+    ("P-053A", "PZ_053A"),
+    ("P-055", "PZ_055_DR"),
+    ("P-056", "PZ_056"),
+    ("P-057", "PZ_057_DR"),
+    ("P-059A", "PZ_059"),
+    ("P-060", "PZ_060_DR"),
+    ("P-061", "PZ_061"),
+    ("P-062", "PZ_062_DR"),
+    ("P-063A", "PZ_063A"),
+    ("P-064", "PZ_064_DR"),
+    ("P-066", "PZ_066_DR"),
+    ("P-067", "PZ_067_DR"),
+    ("P-068", "PZ_RB_068_DR"),
+    # El literal anterior repetía "P-069A" y ganaba el segundo bloque: P-069A se alimenta de PZ_070A_TRCANT.
+    # Pasar PZ_069A_DR a P-069A y PZ_070A_TRCANT a P-070A espera confirmación del dueño del sheet.
+    ("P-069A", "PZ_070A_TRCANT"),
+    ("P-071", "PZ_071_DR"),
+    ("P-072A", "PZ_072A_DR"),
+    ("P-073", "PZ_073_TRC"),
+    ("P-075", "PZ_075_TRINS"),
+    ("P-076", "PZ_076_TRINS"),
+    ("P-077", "PZ_077_DR"),
+    ("P-078A", "PZ_078A_TRMOL"),
+    ("P-079", "PZ_079_TREUC"),
+    ("P-080A", "PZ_080A_TRM"),
+    ("P-082", "PZ_082_TRINS"),
+    ("P-083A", "PZ_083A"),
+    ("P-084A", "PZ_084A_TRC"),
+    ("P-085", "PZ_085"),
+    ("P-086", "PZ_086_DR"),
+    ("P-087", "PZ_087_LP"),
+    ("P-088", "PZ_088_DR"),
+    ("P-089", "PZ_089"),
+    ("P-091A", "PZ_091A"),
+    ("P-092", "PZ_092_TRC"),
+    ("P-093", "PZ_093"),
+    ("P-094A", "PZ_094A"),
+    ("P-095", "PZ_095_DR"),
+    ("P-096A", "PZ_096A"),
+    ("P-097A", "PZ_097A_DR"),
+    ("P-098A", "PZ_098A_DR"),
+    ("P-099A", "PZ_099A_TRM"),
+    ("P-100A", "PZ_100A_DR"),
+    ("P-102A", "PZ_102A_TRCCAPAMA"),
+    ("P-105", "PZ_105_DR"),
+    ("P-106", "PZ_106_TRCANT"),
+    ("P-106A", "PZ_106A_TRCANT"),
+    ("P-107", "PZ_107_TRCANT"),
+    ("P-108", "PZ_108_DR"),
+    ("P-110A", "PZ_110A_TRINS"),
+    ("P-111A", "PZ_111A_TRMOL"),
+    ("P-113A", "PZ_113A_TRMOL"),
+    ("P-114", "PZ_114_DR"),
+    ("P-115A", "PZ_115A"),
+    ("P-116A", "PZ_116A_TRJT"),
+    ("P-118A", "PZ_118A_TRVALLCAM"),
+    ("P-119A", "PZ_119A_DR"),
+    ("P-120A", "PZ_120A_DR"),
+    ("P-124", "PZ_124_DR"),
+    ("P-125", "PZ_125_TRM"),
+    ("P-125A", "PZ_125A_TRMOL"),
+    ("P-126", "PZ_126_TRM"),
+    ("P-129", "PZ_129_DR"),
+    ("P-130", "PZ_130_DR"),
+    ("P-131", "PZ_131_TRM"),
+    ("P-132", "PZ_132_TRHDAS"),
+    ("P-134", "PZ_134_TRM"),
+    ("P-135A", "PZ_135A"),
+    ("P-136", "PZ_136_DR"),
+    ("P-138", "PZ_138_TRHDAS"),
+    ("P-139", "PZ_139_DR"),
+    ("P-140", "PZ_140_DR"),
+    ("P-142", "PZ_142_DR"),
+    ("P-143", "PZ_143"),
+    ("P-144", "PZ_144_DR"),
+    ("P-145", "PZ_145_DR"),
+    ("P-147", "PZ_147_DR"),
+    ("P-150", "PZ_150_TRHDAS"),
+    ("P-151", "PZ_151_DR"),
+    ("P-152", "PZ_152_DR"),
+    ("P-153", "PZ_153_DR"),
+    ("P-156", "PZ_156_DR"),
+    ("P-157", "PZ_157_DR"),
+    ("P-158", "PZ_158_DR"),
+    ("P-159", "PZ_159"),
+    ("P-161", "PZ_161_DR"),
+    ("P-162", "PZ_TQ_162"),
+    ("P-163", "PZ_163"),
+    ("P-165", "PZ_165_DR"),
+    # ("P-", "PZ_167"): nombre de pozo incompleto en el literal anterior; queda fuera hasta confirmar su pozo
+    ("P-169", None),
+    ("P-170", "PZ_170_DR"),
+    ("P-171", "PZ_171_DR"),
+    ("P-173", "PZ_173"),
+    ("P-175", "PZ_175"),
+    ("P-177", "PZ_177"),
+    ("P-178", "PZ_178"),
+    ("P-181", "PZ_181"),
+    ("P-182", "PZ_182_DR"),
+    ("P-183A", "PZ_183A"),
+    ("P-195", "PZ_195"),
+    ("R-020B", "PZ_RB_020B"),
+    ("R-024A", "PZ_R24_CAL"),
+    ("R-086", "PZ_025_DR"),
+]
+
+EXCEPCIONES = {
+    "P-045": {
+        "GASTO_(l.p.s.)":   "TQ_P_045_CAU_INS1",
+        "PRESION_(kg/cm2)": "TQ_P_045_PRES_INS1",
+        "VOLTAJE_L1":       "TQ_P_045_VOL_L1_L21",
+        "VOLTAJE_L2":       "TQ_P_045_VOL_L2_L31",
+        "VOLTAJE_L3":       "TQ_P_045_VOL_L1_L31",
+        "AMP_L1":           "TQ_P_045_CORR_L11",
+        "AMP_L2":           "TQ_P_045_CORR_L21",
+        "AMP_L3":           "TQ_P_045_CORR_L31",
+    },
+    "P-169": {
+        "GASTO_(l.p.s.)":   "TQ_T_169_DR_CAU_INS1",
+        "PRESION_(kg/cm2)": "PZ_SNGER_PRES_R",
+        "VOLTAJE_L1":       "PZ_SNGER_V_L1",
+        "VOLTAJE_L2":       "PZ_SNGER_V_L2",
+        "VOLTAJE_L3":       "PZ_SNGER_V_L3",
+        "AMP_L1":           "PZ_SNGER_I_L1",
+        "AMP_L2":           "PZ_SNGER_I_L2",
+        "AMP_L3":           "PZ_SNGER_I_L3",
+    },
+}
+
+
+class ErrorMapeo(ValueError):
+    pass
+
+
+# Nombre de pozo válido: letras, guion y número/sufijo ("P-069A", "R-020B")
+PATRON_POZO = re.compile(r'^[A-Z]+-\w+$')
+
+
+class RegistroScada:
+    # Arreglos paralelos (pozos[i], columnas[i], tags[i]) más índices tag→i y pozo→tags
+    def __init__(self, pozos, sufijos, excepciones):
+        errores = []
+        self.mapeo = {}
+        for pozo, prefijo in pozos:
+            if pozo in self.mapeo:
+                errores.append(f"pozo duplicado: {pozo}")
+                continue
+            if not PATRON_POZO.match(pozo):
+                errores.append(f"nombre de pozo inválido: {pozo!r}")
+                continue
+            config = {col: f"{prefijo}_{suf}" for col, suf in sufijos.items()} if prefijo else {}
+            for col, tag in excepciones.get(pozo, {}).items():
+                if tag is None: config.pop(col, None)
+                else: config[col] = tag
+            if not config:
+                errores.append(f"pozo sin tags: {pozo}")
+            self.mapeo[pozo] = config
+        for pozo in excepciones:
+            if pozo not in self.mapeo:
+                errores.append(f"excepción para pozo no declarado: {pozo}")
+
+        self.pozos, self.columnas, self.tags = [], [], []
+        self.indice_tag = {}
+        self.tags_por_pozo = {}
+        for pozo, config in self.mapeo.items():
+            self.tags_por_pozo[pozo] = tuple(config.values())
+            for col, tag in config.items():
+                if tag in self.indice_tag:
+                    i = self.indice_tag[tag]
+                    errores.append(f"tag {tag} asignado a {self.pozos[i]}/{self.columnas[i]} y a {pozo}/{col}")
+                    continue
+                self.indice_tag[tag] = len(self.tags)
+                self.pozos.append(pozo)
+                self.columnas.append(col)
+                self.tags.append(tag)
+        if errores:
+            raise ErrorMapeo("MAPEO_SCADA inválido: " + "; ".join(errores))
+
+        self.pozos, self.columnas, self.tags = tuple(self.pozos), tuple(self.columnas), tuple(self.tags)
+
+    @cached_property
+    def tabla(self):
+        # Tabla larga (POZOS, COLUMNA, NAME) para el merge de inyección; no se debe modificar.
+        # Se arma (e importa pandas) en la primera inyección, no al importar el módulo.
+        import pandas as pd
+        return pd.DataFrame({'POZOS': self.pozos, 'COLUMNA': self.columnas, 'NAME': self.tags})
+
+    def destino(self, tag):
+        i = self.indice_tag[tag]
+        return self.pozos[i], self.columnas[i]
+
+
+REGISTRO_SCADA = RegistroScada(POZOS, SUFIJOS, EXCEPCIONES)
+MAPEO_SCADA = REGISTRO_SCADA.mapeo
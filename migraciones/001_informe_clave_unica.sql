@@ -0,0 +1,11 @@
+-- Índice único sobre la llave de INFORME (una sola vez, por el DBA; la sincronización no hace DDL).
+-- escribir_informe sólo hace upserts diferenciales (INSERT ... ON DUPLICATE KEY UPDATE) si este
+-- índice existe; sin él avisa en el log y cae en la recarga completa de cada ciclo.
+--
+-- Antes de aplicarlo, INFORME no debe tener POZOS repetidos ni nulos:
+--   SELECT POZOS, COUNT(*) FROM INFORME GROUP BY POZOS HAVING COUNT(*) > 1 OR POZOS IS NULL;
+--
+-- POZOS como VARCHAR:
+ALTER TABLE INFORME ADD UNIQUE INDEX ux_informe_clave (POZOS);
+-- POZOS como TEXT (la tabla la creó pandas): MySQL exige longitud de prefijo
+-- ALTER TABLE INFORME ADD UNIQUE INDEX ux_informe_clave (POZOS(100));
@@ -0,0 +1,74 @@
+import argparse
+import json
+import time
+
+from sqlalchemy import create_engine, text
+
+import generador_datos
+import sincronizacion as sync
+
+# Reproduce una corrida capturada (CAPTURA_DIR / MIAA_CAPTURA_DIR) contra MySQL/Postgres locales.
+#
+#   python reproducir_sync.py .capturas/20261017_120000 \
+#       --mysql-url mysql+mysqlconnector://root:pw@127.0.0.1/bench \
+#       --pg-url postgresql://postgres:pw@127.0.0.1/bench --preparar --repeticiones 3
+#
+# Corre parseo del sheet, inyección SCADA y las escrituras de INFORME y "Pozos" con las entradas
+# exactas de producción. La primera repetición es en frío (sin snapshots); las siguientes reusan
+# los mismos recursos y miden el ciclo en caliente. También avisa si la transformación actual ya
+# no produce los mismos payloads que se capturaron.
+
+
+def preparar_bases(eng_my, pg_url, captura):
+    # INFORME se crea en la primera escritura; "Pozos" necesita sus ID antes del UPDATE
+    with eng_my.begin() as conn:
+        for tabla in (sync.INFORME_TABLA, f"{sync.INFORME_TABLA}_new", f"{sync.INFORME_TABLA}_old"):
+            conn.execute(text(f"DROP TABLE IF EXISTS {tabla}"))
+    generador_datos.cargar_postgres(pg_url, captura['pozos'][['ID']])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reproduce una captura de sincronización contra BD locales")
+    parser.add_argument('captura', help="Carpeta de una corrida capturada")
+    parser.add_argument('--mysql-url', required=True, help="MySQL local para INFORME")
+    parser.add_argument('--pg-url', required=True, help='Postgres local para "Pozos"')
+    parser.add_argument('--preparar', action='store_true', help='Recrea INFORME y "Pozos" antes de reproducir')
+    parser.add_argument('--repeticiones', type=int, default=2)
+    parser.add_argument('--salida', help="Archivo JSON de resultados (por omisión, stdout)")
+    args = parser.parse_args(argv)
+
+    captura = sync.cargar_captura(args.captura)
+    eng_my = create_engine(args.mysql_url, **sync.POOL_OPCIONES)
+    eng_pg = create_engine(args.pg_url, **sync.POOL_OPCIONES)
+    if args.preparar:
+        preparar_bases(eng_my, args.pg_url, captura)
+    motores = {'scada': None, 'informe': eng_my, 'postgres': eng_pg}
+    recursos = sync.crear_recursos(None, None, None, motores=motores, captura=None)
+
+    resultados = []
+    try:
+        for i in range(args.repeticiones):
+            etapas = sync.Etapas()
+            t0 = time.time()
+            coincide, destinos = sync.reproducir_captura(captura, recursos, etapas)
+            resultados.append({'repeticion': i, 'total_s': round(time.time() - t0, 3), 'coincide': coincide,
+                               'informe_ruta': recursos['informe']['ruta'],
+                               'destinos': {nombre: {'ok': ok, 'resultado': res, 's': s} for nombre, (ok, res, s) in destinos.items()},
+                               'etapas': etapas.datos})
+            if args.preparar and i == 0:
+                # INFORME recién creado por la repetición en frío: índice único de migraciones/ para que
+                # las repeticiones en caliente midan el upsert diferencial y no la recarga completa
+                generador_datos.aplicar_clave_informe(eng_my)
+    finally:
+        eng_my.dispose()
+        eng_pg.dispose()
+
+    salida = json.dumps(resultados, ensure_ascii=False, indent=1, default=str)
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f: f.write(salida)
+    else:
+        print(salida)
+
+
+if __name__ == '__main__':
+    main()
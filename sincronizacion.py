@@ -0,0 +1,1155 @@
+import urllib.parse
+import io
+import os
+import json
+import hashlib
+import sys
+import signal
+import argparse
+import threading
+import shutil
+import subprocess
+from contextlib import contextmanager
+import urllib.request
+import urllib.error
+import datetime
+import time
+import pytz
+from concurrent.futures import ThreadPoolExecutor, Future
+from mapeo_scada import REGISTRO_SCADA
+
+# Lógica de sincronización SCADA + Google Sheets → MySQL INFORME / Postgres "Pozos".
+# No depende de Streamlit: app_web.py (y cualquier otro proceso) crea los recursos con
+# crear_recursos() una sola vez y llama a sincronizar() en cada ciclo.
+
+# pandas, SQLAlchemy y los drivers se importan dentro de las funciones que los usan: la interfaz
+# y la CLI arrancan sin pagarlos y el candado de import de Python los hace seguros entre hilos.
+
+# --- 1. CONFIGURACIÓN ---
+zona_local = pytz.timezone('America/Mexico_City')
+
+CSV_URL = 'https://docs.google.com/spreadsheets/d/1tHh47x6DWZs_vCaSCHshYPJrQKUW7Pqj86NCVBxKnuw/gviz/tq?tqx=out:csv&sheet=informe'
+
+# Ventana de búsqueda hacia atrás para el último valor de cada tag SCADA
+SCADA_VENTANA_HORAS = 24
+# Cada cuánto se vuelve a resolver NAME→GATEID contra VfiTagRef (segundos)
+GATEID_REFRESCO_S = 3600
+# Traslape hacia atrás sobre la marca de agua para no perder muestras que llegan tarde (segundos)
+SCADA_TRASLAPE_S = 120
+# Consulta SCADA en shards de N GATEIDs, varios a la vez sobre conexiones del pool
+SCADA_TAGS_POR_SHARD = 400
+SCADA_SHARDS_PARALELOS = 4
+# Modo de lectura del histórico: 'maximo' (MAX(FECHA) por GATEID en el servidor) o
+# 'streaming' (cursor sin buffer leído por bloques, para históricos sin índice útil)
+SCADA_MODO_LECTURA = 'maximo'
+SCADA_CHUNK = 50000
+
+# Tabla INFORME: llave de upsert y tamaño de lote del INSERT multi-fila
+INFORME_TABLA = 'INFORME'
+INFORME_CLAVE = 'POZOS'
+INFORME_LOTE = 500
+# Recarga completa de INFORME: 'swap' (carga en INFORME_new + RENAME TABLE atómico) o 'truncate'
+INFORME_MODO_RECARGA = 'swap'
+
+# Tabla temporal de staging para el UPDATE masivo de public."Pozos"
+PG_STAGING = 'pozos_staging'
+# Banda muerta numérica: cambios de |Δ| <= PG_DEADBAND no se reescriben en "Pozos". Queda por debajo
+# del paso de redondeo de la inyección (0.01) para que un cambio de un dígito no dependa del error de float.
+PG_DEADBAND = 0.005
+
+# Caché local del CSV de Google Sheets (payload crudo + ETag/Last-Modified/hash)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+SHEET_TIMEOUT = 30
+
+# Historial de ejecuciones con tiempos por etapa (JSON por línea) y ventana para percentiles en la UI
+HISTORIAL_ARCHIVO = os.path.join(CACHE_DIR, 'historial_sync.jsonl')
+HISTORIAL_MAX = 2000
+HISTORIAL_N = 100
+
+# Captura por corrida del CSV crudo, el resultado SCADA y los payloads de escritura (Parquet) para
+# reproducirla fuera de línea con reproducir_sync.py. Apagada con None; se conservan las últimas CAPTURA_MAX.
+CAPTURA_DIR = os.environ.get('MIAA_CAPTURA_DIR') or None
+CAPTURA_MAX = 50
+CAPTURA_FORMATO = '%Y%m%d_%H%M%S'
+
+# Candado de asesoría en MySQL INFORME para que dos procesos no sincronicen a la vez
+SYNC_LOCK_NOMBRE = 'miaa_sincronizacion_total'
+
+# Pool de conexiones compartido entre ciclos (pre-ping y reciclado para conexiones ociosas)
+POOL_OPCIONES = dict(pool_size=5, max_overflow=2, pool_pre_ping=True, pool_recycle=1800)
+
+# Mapeo Completo Integrado
+MAPEO_POSTGRES = {
+    'GASTO_(l.p.s.)':                  '_Caudal',
+    'PRESION_(kg/cm2)':                '_Presion',
+    'LONGITUD_DE_COLUMNA':             '_Long_colum',
+    'COLUMNA_DIAMETRO_1':              '_Diam_colum',
+    'TIPO_COLUMNA':                    '_Tipo_colum',
+    'SECTOR_HIDRAULICO':               '_Sector',
+    'NIVEL_DINAMICO_(mts)':            '_Nivel_Din',
+    'NIVEL_ESTATICO_(mts)':            '_Nivel_Est',
+    'EXTRACCION_MENSUAL_(m3)':         '_Vm_estr',
+    'HORAS_DE_OPERACIÓN_DIARIA_(hrs)': '_Horas_op',
+    'DISTRITO_1':                      '_Distrito',
+    'ESTATUS':                         '_Estatus',
+    'TELEMETRIA':                      '_Telemetria',
+    'FECHA_ACTUALIZACION':             '_Ultima_actualizacion'
+}
+
+# Esquema declarado del sheet "informe": 'texto', 'numero' (admite separador de miles ',') o 'fecha'.
+# Incluye las columnas destino de SCADA; las columnas que no aparecen aquí se leen con inferencia.
+ESQUEMA_SHEET = {
+    'POZOS':                           'texto',
+    'ID':                              'texto',
+    'GASTO_(l.p.s.)':                  'numero',
+    'PRESION_(kg/cm2)':                'numero',
+    'LONGITUD_DE_COLUMNA':             'numero',
+    'COLUMNA_DIAMETRO_1':              'numero',
+    'TIPO_COLUMNA':                    'texto',
+    'SECTOR_HIDRAULICO':               'texto',
+    'NIVEL_DINAMICO_(mts)':            'numero',
+    'NIVEL_ESTATICO_(mts)':            'numero',
+    'EXTRACCION_MENSUAL_(m3)':         'numero',
+    'HORAS_DE_OPERACIÓN_DIARIA_(hrs)': 'numero',
+    'DISTRITO_1':                      'texto',
+    'ESTATUS':                         'texto',
+    'TELEMETRIA':                      'texto',
+    'FECHA_ACTUALIZACION':             'fecha',
+    **{col: 'numero' for col in REGISTRO_SCADA.columnas},
+}
+# Formato conocido de FECHA_ACTUALIZACION (None = inferir)
+SHEET_FORMATO_FECHA = None
+# INFORME replica el sheet completo; True lee sólo las columnas del esquema
+SHEET_PROYECTAR = False
+
+# Credenciales para la ejecución sin interfaz: mismo TOML que usa st.secrets, más variables de entorno
+SECRETOS_TOML = os.environ.get('MIAA_SECRETOS') or os.path.join(os.path.dirname(os.path.abspath(__file__)), '.streamlit', 'secrets.toml')
+SECCIONES_DB = ('db_scada', 'db_informe', 'db_postgres')
+
+# Presupuesto de arranque: import en frío de este módulo (intérprete nuevo) y render de cada rerun de app_web.py.
+# Las dependencias pesadas no deben cargarse al importar; se revisa con python -m sincronizacion arranque.
+PRESUPUESTO_IMPORT_MS = 250
+PRESUPUESTO_RERUN_MS = 300
+MODULOS_PESADOS = ('pandas', 'numpy', 'sqlalchemy', 'mysql.connector', 'psycopg2', 'pyarrow')
+
+# --- 2. LÓGICA DE PROCESAMIENTO ---
+
+class Motores(dict):
+    # Engine por servidor creado en el primer acceso: el driver (mysql.connector, psycopg2) no se
+    # importa hasta que una sincronización o un ping lo necesita. values()/items() sólo ven los creados.
+    def __init__(self, recetas):
+        super().__init__()
+        self.recetas = recetas
+        self._lock = threading.Lock()
+
+    def __missing__(self, nombre):
+        from sqlalchemy import create_engine
+        with self._lock:
+            if not dict.__contains__(self, nombre):
+                url, opciones = self.recetas[nombre]
+                self[nombre] = create_engine(url, **opciones, **POOL_OPCIONES)
+            return dict.__getitem__(self, nombre)
+
+def crear_motores(db_scada, db_informe, db_postgres):
+    # Un engine con pool por servidor; se crea una vez por proceso y se reutiliza entre ciclos
+    p_my = urllib.parse.quote_plus(db_informe['password'])
+    p_pg = urllib.parse.quote_plus(db_postgres['pass'])
+    return Motores({
+        'scada': ("mysql+mysqlconnector://", {'connect_args': db_scada}),
+        'informe': (f"mysql+mysqlconnector://{db_informe['user']}:{p_my}@{db_informe['host']}/{db_informe['database']}", {}),
+        'postgres': (f"postgresql://{db_postgres['user']}:{p_pg}@{db_postgres['host']}:{db_postgres['port']}/{db_postgres['db']}", {}),
+    })
+
+def salud_conexiones(motores, ping=False):
+    from sqlalchemy import text
+    salud = {}
+    for nombre in getattr(motores, 'recetas', motores):
+        if not ping and nombre not in motores:
+            salud[nombre] = {'pool': "sin crear (se conecta en la primera sincronización)"}
+            continue
+        eng = motores[nombre]
+        info = {'pool': eng.pool.status()}
+        if ping:
+            t0 = time.time()
+            try:
+                with eng.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                info['ping'] = f"OK ({round((time.time() - t0) * 1000)} ms)"
+            except Exception as e:
+                info['ping'] = f"ERROR: {e}"
+        salud[nombre] = info
+    return salud
+
+def estado_gateids():
+    # Resolución NAME→GATEID compartida por el proceso; se refresca cada GATEID_REFRESCO_S
+    return {'lock': threading.Lock(), 'resolucion': None, 'no_resueltos': [], 'duplicados': [], 'ts': 0}
+
+def resolver_gateids(conn, estado, tags):
+    import pandas as pd
+    with estado['lock']:
+        if estado['resolucion'] is None or time.time() - estado['ts'] > GATEID_REFRESCO_S:
+            marcadores = ','.join(['%s'] * len(tags))
+            resolucion = pd.read_sql(f"SELECT NAME, GATEID FROM VfiTagRef WHERE NAME IN ({marcadores})", conn, params=list(tags))
+            resolucion['GATEID'] = resolucion['GATEID'].astype('int64')
+            # Un NAME con varios GATEID en VfiTagRef se consulta por todos; gana la muestra más reciente
+            repetidos = resolucion['NAME'][resolucion['NAME'].duplicated()]
+            estado.update(resolucion=resolucion, no_resueltos=sorted(set(tags) - set(resolucion['NAME'])),
+                          duplicados=sorted(set(repetidos)), ts=time.time())
+        return estado['resolucion'], estado['no_resueltos'], estado['duplicados']
+
+def estado_marcas():
+    # Último valor conocido por GATEID (VALUE, FECHA); su FECHA es la marca de agua del tag
+    return {'lock': threading.Lock(), 'ultimos': None}
+
+def _cargar_marcas(estado):
+    import pandas as pd
+    ruta = os.path.join(CACHE_DIR, 'scada_ultimos.csv')
+    if estado['ultimos'] is None and os.path.exists(ruta):
+        estado['ultimos'] = pd.read_csv(ruta, parse_dates=['FECHA'])
+
+def _guardar_marcas(estado):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    estado['ultimos'].to_csv(os.path.join(CACHE_DIR, 'scada_ultimos.csv'), index=False)
+
+def _consultar_max_fecha(conn, gateids, desde):
+    # MAX(FECHA) por GATEID a partir de "desde"; el filtro va directo sobre los GATEID enteros ya resueltos
+    import pandas as pd
+    if not gateids:
+        return pd.DataFrame(columns=['GATEID', 'VALUE', 'FECHA'])
+    marcadores = ','.join(['%s'] * len(gateids))
+    query = (
+        "SELECT h.GATEID, h.VALUE, h.FECHA "
+        "FROM vfitagnumhistory h "
+        "JOIN ("
+        "  SELECT GATEID, MAX(FECHA) AS FECHA "
+        "  FROM vfitagnumhistory "
+        f"  WHERE GATEID IN ({marcadores}) AND FECHA >= %s "
+        "  GROUP BY GATEID"
+        ") ult ON h.GATEID = ult.GATEID AND h.FECHA = ult.FECHA"
+    )
+    df_h = pd.read_sql(query, conn, params=list(gateids) + [desde.to_pydatetime()])
+    # Empates en FECHA pueden devolver más de un renglón por GATEID
+    return df_h.drop_duplicates('GATEID')
+
+def plegar_ultimos(bloques, columnas=('GATEID', 'VALUE', 'FECHA')):
+    # Pliega bloques GATEID/VALUE/FECHA al "último por GATEID" acumulado: la memoria es O(tags), no O(filas)
+    import pandas as pd
+    ultimos = pd.DataFrame(columns=list(columnas))
+    for bloque in bloques:
+        bloque = bloque.loc[bloque.groupby('GATEID')['FECHA'].idxmax()]
+        ultimos = pd.concat([ultimos, bloque], ignore_index=True) if len(ultimos) else bloque
+        ultimos = ultimos.sort_values('FECHA', kind='stable').drop_duplicates('GATEID', keep='last')
+    return ultimos
+
+def _consultar_streaming(conn, gateids, desde):
+    # Cursor sin buffer (el dialecto mysqlconnector los pide con buffer por omisión) y fetchmany
+    # por bloques de SCADA_CHUNK que se pliegan con plegar_ultimos.
+    import pandas as pd
+    columnas = ['GATEID', 'VALUE', 'FECHA']
+    if not gateids:
+        return pd.DataFrame(columns=columnas)
+    marcadores = ','.join(['%s'] * len(gateids))
+    cur = conn.cursor(buffered=False)
+    try:
+        cur.execute(f"SELECT GATEID, VALUE, FECHA FROM vfitagnumhistory WHERE GATEID IN ({marcadores}) AND FECHA >= %s",
+                    list(gateids) + [desde.to_pydatetime()])
+        def bloques():
+            while filas := cur.fetchmany(SCADA_CHUNK):
+                yield pd.DataFrame(filas, columns=columnas)
+        return plegar_ultimos(bloques(), columnas)
+    finally:
+        cur.close()
+
+def _consultar_en_shards(eng, gateids, desde, tiempos):
+    # Parte el IN (...) en shards para no acercarse a los límites de paquete/plan y
+    # aprovechar el paralelismo del servidor; cada shard usa su propia conexión del pool.
+    # "desde" es un instante común o una Serie GATEID→desde; con Serie cada shard parte de la más vieja de sus tags.
+    import pandas as pd
+    def shard(lote):
+        t0 = time.time()
+        conn = eng.raw_connection()
+        try:
+            consulta = _consultar_streaming if SCADA_MODO_LECTURA == 'streaming' else _consultar_max_fecha
+            desde_lote = desde.loc[lote].min() if isinstance(desde, pd.Series) else desde
+            return consulta(conn, lote, desde_lote), round(time.time() - t0, 2)
+        finally:
+            conn.close()
+    lotes = [gateids[i:i + SCADA_TAGS_POR_SHARD] for i in range(0, len(gateids), SCADA_TAGS_POR_SHARD)]
+    if len(lotes) <= 1:
+        resultados = [shard(lote) for lote in lotes]
+    else:
+        with ThreadPoolExecutor(max_workers=min(SCADA_SHARDS_PARALELOS, len(lotes))) as pool:
+            resultados = list(pool.map(shard, lotes))
+    tiempos.extend(t for _, t in resultados)
+    return [df_h for df_h, _ in resultados]
+
+def _ahora_db(conn):
+    import pandas as pd
+    return pd.read_sql("SELECT NOW() AS AHORA", conn)['AHORA'].iloc[0]
+
+def consultar_ultimos_valores(eng, conn, resolucion, estado, ventana_horas=SCADA_VENTANA_HORAS):
+    # Un solo renglón por tag. Los tags con marca de agua sólo piden al histórico la cola
+    # posterior a su propia última FECHA vista; si no hay muestra nueva se conserva el último valor
+    # conocido mientras siga dentro de la ventana.
+    import pandas as pd
+    gateids = sorted(set(resolucion['GATEID'].tolist()))
+    with estado['lock']:
+        _cargar_marcas(estado)
+        corte = _ahora_db(conn) - pd.Timedelta(hours=ventana_horas)
+        previos = estado['ultimos'] if estado['ultimos'] is not None else pd.DataFrame(columns=['GATEID', 'VALUE', 'FECHA'])
+        conocidos = set(previos['GATEID'].tolist())
+        cola = [g for g in gateids if g in conocidos]
+        completos = [g for g in gateids if g not in conocidos]
+        nuevos, tiempos = [], []
+        if cola:
+            # Marca de agua por tag: un tag adelantado (reloj de RTU corrido) o un respaldo tardío de
+            # otro tag no mueve la de los demás. Ordenados por marca, los shards agrupan marcas parecidas.
+            marcas = pd.to_datetime(previos.set_index('GATEID')['FECHA']).loc[cola]
+            desde = (marcas - pd.Timedelta(seconds=SCADA_TRASLAPE_S)).clip(lower=corte).sort_values(kind='stable')
+            nuevos.extend(_consultar_en_shards(eng, list(desde.index), desde, tiempos))
+        if completos:
+            nuevos.extend(_consultar_en_shards(eng, completos, corte, tiempos))
+        nuevos = pd.concat(nuevos, ignore_index=True) if nuevos else previos.iloc[0:0]
+        combinado = pd.concat([previos, nuevos], ignore_index=True)
+        combinado['GATEID'] = combinado['GATEID'].astype('int64')
+        combinado['FECHA'] = pd.to_datetime(combinado['FECHA'])
+        combinado = combinado.sort_values('FECHA').drop_duplicates('GATEID', keep='last')
+        combinado = combinado[combinado['FECHA'] >= corte].reset_index(drop=True)
+        estado['ultimos'] = combinado
+        _guardar_marcas(estado)
+
+    vigentes = combinado[combinado['GATEID'].isin(gateids)]
+    df_scada = resolucion.merge(vigentes, on='GATEID')[['NAME', 'VALUE', 'FECHA']]
+    df_scada = df_scada.sort_values('FECHA', kind='stable').drop_duplicates('NAME', keep='last').reset_index(drop=True)
+    sin_dato = sorted(set(resolucion['NAME']) - set(df_scada['NAME']))
+    return df_scada, sin_dato, len(nuevos), tiempos
+
+def _resumir(nombres, n=5):
+    return ', '.join(nombres[:n]) + ('...' if len(nombres) > n else '')
+
+def inyectar_valores_scada(df, df_scada, tabla):
+    # Un solo merge tag→valor y un pivot (pozo × columna) que se asigna de golpe sobre df
+    import pandas as pd
+    vals = tabla[tabla['COLUMNA'].isin(df.columns)].merge(df_scada[['NAME', 'VALUE']], on='NAME')
+    vals['VALUE'] = pd.to_numeric(vals['VALUE'], errors='coerce').round(2)
+    vals = vals.dropna(subset=['VALUE'])
+    if vals.empty:
+        return 0
+    pivot = vals.pivot(index='POZOS', columns='COLUMNA', values='VALUE')
+    nuevos = pivot.reindex(df['POZOS'].values)
+    nuevos.index = df.index
+    cols = list(pivot.columns)
+    df[cols] = nuevos[cols].combine_first(df[cols])
+    return len(vals)
+
+def estado_informe():
+    # Último snapshot confirmado de INFORME, compartido entre ciclos del proceso; "ruta" es el camino
+    # de la última escritura ('upsert' diferencial o 'recarga' completa)
+    return {'snapshot': None, 'clave_ok': False, 'ruta': None}
+
+def _col_sql(col):
+    # Nombre de columna MySQL entre backticks (los ':' se escapan para text())
+    return '`' + str(col).replace('`', '``').replace(':', '\\:') + '`'
+
+def normalizar_informe(df):
+    return df.astype(object).where(df.notna(), None)
+
+def clave_informe_indexada(eng):
+    # ON DUPLICATE KEY UPDATE necesita un índice único sobre la llave. La sincronización no lo crea:
+    # se aplica una vez con migraciones/001_informe_clave_unica.sql.
+    from sqlalchemy import text
+    with eng.connect() as conn:
+        return bool(conn.execute(text("SELECT COUNT(*) FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE() "
+                                      "AND TABLE_NAME = :t AND COLUMN_NAME = :c AND NON_UNIQUE = 0"),
+                                 {'t': INFORME_TABLA, 'c': INFORME_CLAVE}).scalar())
+
+def filas_modificadas(nuevo, previo, clave=INFORME_CLAVE):
+    a = nuevo.set_index(clave)
+    b = previo.drop_duplicates(clave, keep='last').set_index(clave).reindex(index=a.index, columns=a.columns)
+    iguales = ((a == b) | (a.isna() & b.isna())).all(axis=1)
+    cambiadas = ~iguales | ~a.index.isin(previo[clave])
+    return nuevo[cambiadas.values]
+
+def insertar_lotes(conn, tabla, df_filas, actualizar=False):
+    # INSERT multi-fila por lotes de INFORME_LOTE; con actualizar=True es un upsert sobre la llave
+    from sqlalchemy import text
+    cols = list(df_filas.columns)
+    cols_sql = ', '.join(_col_sql(c) for c in cols)
+    sufijo = ''
+    if actualizar:
+        sufijo = " ON DUPLICATE KEY UPDATE " + ', '.join(f"{_col_sql(c)} = VALUES({_col_sql(c)})" for c in cols if c != INFORME_CLAVE)
+    registros = df_filas.values.tolist()
+    for i in range(0, len(registros), INFORME_LOTE):
+        params, valores = {}, []
+        for j, fila in enumerate(registros[i:i + INFORME_LOTE]):
+            marcas = []
+            for k, v in enumerate(fila):
+                params[f"v{j}_{k}"] = v
+                marcas.append(f":v{j}_{k}")
+            valores.append(f"({', '.join(marcas)})")
+        conn.execute(text(f"INSERT INTO {tabla} ({cols_sql}) VALUES {', '.join(valores)}{sufijo}"), params)
+
+def _tabla_existe(conn, tabla):
+    from sqlalchemy import text
+    return bool(conn.execute(text("SELECT COUNT(*) FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t"), {'t': tabla}).scalar())
+
+def _columnas_tabla(conn, tabla):
+    from sqlalchemy import text
+    return {fila[0] for fila in conn.execute(text("SELECT COLUMN_NAME FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t"), {'t': tabla})}
+
+def recargar_informe(eng, df_sql):
+    # La recarga nunca cambia la definición de INFORME: tipos, collations e índices se conservan.
+    # Si el sheet trae otras columnas se falla en voz alta; el cambio de esquema es una migración.
+    from sqlalchemy import text
+    if INFORME_MODO_RECARGA == 'truncate':
+        with eng.begin() as conn:
+            conn.execute(text(f"TRUNCATE TABLE {INFORME_TABLA}"))
+            df_sql.to_sql(INFORME_TABLA, con=conn, if_exists='append', index=False)
+        return
+    # Tabla sombra: los lectores siguen viendo la INFORME vigente hasta el RENAME atómico
+    nueva, vieja = f"{INFORME_TABLA}_new", f"{INFORME_TABLA}_old"
+    with eng.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {nueva}"))
+        existe = _tabla_existe(conn, INFORME_TABLA)
+        if existe:
+            actuales = _columnas_tabla(conn, INFORME_TABLA)
+            if actuales != set(df_sql.columns):
+                nuevas, faltan = sorted(set(df_sql.columns) - actuales), sorted(actuales - set(df_sql.columns))
+                raise ValueError(f"el sheet no coincide con las columnas de {INFORME_TABLA} "
+                                 f"(nuevas: {_resumir(nuevas) or '-'}; faltan: {_resumir(faltan) or '-'}); migre la tabla")
+            conn.execute(text(f"CREATE TABLE {nueva} LIKE {INFORME_TABLA}"))
+            insertar_lotes(conn, nueva, df_sql)
+        else:
+            # Primera carga: todavía no hay definición que conservar
+            df_sql.to_sql(nueva, con=conn, index=False, method='multi', chunksize=INFORME_LOTE)
+    with eng.begin() as conn:
+        if existe:
+            conn.execute(text(f"DROP TABLE IF EXISTS {vieja}"))
+            conn.execute(text(f"RENAME TABLE {INFORME_TABLA} TO {vieja}, {nueva} TO {INFORME_TABLA}"))
+            conn.execute(text(f"DROP TABLE {vieja}"))
+        else:
+            conn.execute(text(f"RENAME TABLE {nueva} TO {INFORME_TABLA}"))
+
+def escribir_informe(eng, df, estado):
+    # Escritura diferencial: sólo los pozos cuyo renglón cambió desde el último snapshot
+    # confirmado viajan en INSERT ... ON DUPLICATE KEY UPDATE; los pozos que ya no están se borran.
+    import pandas as pd
+    from sqlalchemy import bindparam, text
+    df_sql = normalizar_informe(df)
+    claves = df_sql[INFORME_CLAVE]
+    # Llave vacía o repetida: INFORME se queda como está hasta que se corrija el sheet
+    vacias, repetidas = int(claves.isna().sum()), sorted(claves[claves.duplicated()].dropna().unique())
+    if vacias or repetidas:
+        estado['snapshot'] = None
+        raise ValueError(f"llave {INFORME_CLAVE} inválida en el sheet ({vacias} vacías; repetidas: {_resumir([str(c) for c in repetidas]) or '-'}); "
+                         f"{INFORME_TABLA} no se modificó")
+    try:
+        if not estado['clave_ok']:
+            estado['clave_ok'] = clave_informe_indexada(eng)
+        previo = estado['snapshot']
+        if previo is None and estado['clave_ok']:
+            with eng.connect() as conn:
+                previo = normalizar_informe(pd.read_sql(text(f"SELECT * FROM {INFORME_TABLA}"), conn))
+        if not estado['clave_ok']:
+            recargar_informe(eng, df_sql)
+            estado.update(snapshot=df_sql, clave_ok=False, ruta='recarga')
+            return (f"⚠️ recarga completa {INFORME_MODO_RECARGA} ({len(df_sql)} filas): {INFORME_TABLA} no tiene índice único "
+                    f"sobre {INFORME_CLAVE}, aplique migraciones/001_informe_clave_unica.sql"), len(df_sql)
+        if set(previo.columns) != set(df_sql.columns):
+            recargar_informe(eng, df_sql)
+            estado.update(snapshot=df_sql, clave_ok=False, ruta='recarga')
+            return f"recarga completa {INFORME_MODO_RECARGA} ({len(df_sql)} filas)", len(df_sql)
+
+        cambios = filas_modificadas(df_sql, previo)
+        borrar = sorted(set(previo[INFORME_CLAVE].dropna()) - set(claves))
+        with eng.begin() as conn:
+            if len(cambios):
+                insertar_lotes(conn, INFORME_TABLA, cambios, actualizar=True)
+            if borrar:
+                stmt = text(f"DELETE FROM {INFORME_TABLA} WHERE {_col_sql(INFORME_CLAVE)} IN :claves").bindparams(bindparam('claves', expanding=True))
+                conn.execute(stmt, {'claves': borrar})
+        estado.update(snapshot=df_sql, ruta='upsert')
+        return f"{len(cambios)} filas actualizadas, {len(borrar)} borradas", len(cambios) + len(borrar)
+    except Exception:
+        # Ante cualquier falla el snapshot deja de ser confiable: se relee de la BD en el siguiente ciclo
+        estado['snapshot'] = None
+        raise
+
+def payload_pozos(df):
+    # Limpieza por columna en un solo paso: IDs válidos, números con to_numeric (el texto que no es
+    # número se conserva), fechas con to_datetime; los NaN/NaT quedan como NULL al escribir.
+    import pandas as pd
+    cols_pg = [(csv_col, pg_col) for csv_col, pg_col in MAPEO_POSTGRES.items() if csv_col in df.columns]
+    ids = df['ID'].astype(str).str.strip()
+    validos = df['ID'].notna() & (ids != '') & (ids.str.lower() != 'nan')
+    payload = pd.DataFrame({'ID': ids[validos]})
+    for csv_col, pg_col in cols_pg:
+        col = df.loc[validos, csv_col]
+        if pg_col == '_Ultima_actualizacion':
+            payload[pg_col] = pd.to_datetime(col, errors='coerce')
+            continue
+        if not pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_datetime64_any_dtype(col):
+            col = col.where(col.astype(str).str.lower() != 'nan')
+            num = pd.to_numeric(col, errors='coerce')
+            col = num if num.notna().sum() == col.notna().sum() else col.where(num.isna(), num)
+        if pd.api.types.is_float_dtype(col):
+            # 150.0 → 150 para que COPY lo acepte también en columnas enteras
+            presentes = col.dropna()
+            if len(presentes) and (presentes == presentes.round()).all():
+                col = col.astype('Int64')
+        payload[pg_col] = col
+    # Con IDs repetidos gana el último renglón, igual que los UPDATE secuenciales
+    return payload.drop_duplicates('ID', keep='last')
+
+def estado_pozos():
+    # Último valor escrito por (ID, columna) en public."Pozos", compartido por el proceso
+    return {'lock': threading.Lock(), 'escrito': None}
+
+def _leer_pozos_pg(conn, columnas):
+    import pandas as pd
+    from sqlalchemy import text
+    nombres = ', '.join(f'"{col}"' for col in columnas)
+    previo = pd.read_sql(text(f'SELECT {nombres} FROM public."Pozos"'), conn)
+    previo['ID'] = previo['ID'].astype(str).str.strip()
+    return previo.drop_duplicates('ID', keep='last').set_index('ID').astype(object)
+
+def celdas_cambiadas(payload, previo, tolerancia=PG_DEADBAND):
+    # Máscara (ID × columna) de las celdas que difieren de lo último escrito
+    import pandas as pd
+    nuevo = payload.set_index('ID')
+    base = previo.reindex(index=nuevo.index, columns=nuevo.columns)
+    mascara = pd.DataFrame(False, index=nuevo.index, columns=nuevo.columns)
+    for col in nuevo.columns:
+        a, b = nuevo[col], base[col]
+        na_a, na_b = a.isna(), b.isna()
+        if pd.api.types.is_numeric_dtype(a):
+            b_num = pd.to_numeric(b, errors='coerce')
+            distinto = ((a.astype('float64') - b_num).abs() > tolerancia) | b_num.isna()
+        elif pd.api.types.is_datetime64_any_dtype(a):
+            b_dt = pd.to_datetime(b, errors='coerce')
+            if getattr(b_dt.dt, 'tz', None) is not None:
+                b_dt = b_dt.dt.tz_localize(None)
+            distinto = a != b_dt
+        else:
+            distinto = a.astype(str) != b.astype(str)
+        mascara[col] = (na_a != na_b) | (~na_a & ~na_b & distinto)
+    return nuevo, mascara
+
+def actualizar_pozos_pg(conn, nuevo, mascara):
+    # COPY de sólo los pozos y columnas con cambios a una tabla temporal y un solo UPDATE ... FROM;
+    # en columnas que cambiaron sólo en algunos pozos, una bandera por celda conserva el valor actual.
+    from sqlalchemy import text
+    filas = mascara.any(axis=1)
+    cols = [col for col in mascara.columns if mascara[col].any()]
+    if not filas.any():
+        return 0, 0, 0
+    marcas = mascara.loc[filas, cols]
+    datos = nuevo.loc[filas, cols].reset_index()
+    banderas = [f"_m{i}" for i in range(len(cols))]
+    for bandera, col in zip(banderas, cols):
+        datos[bandera] = marcas[col].values
+
+    nombres = ', '.join(['"ID"'] + [f'"{col}"' for col in cols])
+    # La staging hereda los tipos de "Pozos" para que COPY haga las conversiones
+    extra = ''.join(f', NULL::boolean AS "{bandera}"' for bandera in banderas)
+    conn.execute(text(f'CREATE TEMP TABLE {PG_STAGING} ON COMMIT DROP AS SELECT {nombres}{extra} FROM public."Pozos" WITH NO DATA'))
+    buffer = io.StringIO()
+    datos.to_csv(buffer, header=False, index=False, na_rep='\\N', date_format='%Y-%m-%d %H:%M:%S')
+    buffer.seek(0)
+    cur = conn.connection.cursor()
+    try:
+        todas = nombres + ''.join(f', "{bandera}"' for bandera in banderas)
+        cur.copy_expert(f"COPY {PG_STAGING} ({todas}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+    finally:
+        cur.close()
+
+    sets = []
+    for bandera, col in zip(banderas, cols):
+        if marcas[col].all():
+            sets.append(f'"{col}" = s."{col}"')
+        else:
+            sets.append(f'"{col}" = CASE WHEN s."{bandera}" THEN s."{col}" ELSE p."{col}" END')
+    res = conn.execute(text(f'UPDATE public."Pozos" p SET {", ".join(sets)} FROM {PG_STAGING} s WHERE p."ID" = s."ID"'))
+    return res.rowcount, int(filas.sum()), len(cols)
+
+def escribir_pozos(eng, payload, estado):
+    if payload.empty or len(payload.columns) < 2:
+        return "sin columnas para escribir", 0
+    with estado['lock']:
+        try:
+            with eng.begin() as conn:
+                escrito = estado['escrito']
+                if escrito is None or not set(payload.columns[1:]) <= set(escrito.columns):
+                    escrito = _leer_pozos_pg(conn, list(payload.columns))
+                nuevo, mascara = celdas_cambiadas(payload, escrito)
+                filas_pg, n_pozos, n_cols = actualizar_pozos_pg(conn, nuevo, mascara)
+        except Exception:
+            estado['escrito'] = None
+            raise
+        # Confirmado: se recuerda lo escrito; las celdas dentro de la banda muerta conservan su valor anterior
+        escrito = escrito.reindex(escrito.index.union(nuevo.index)).astype(object)
+        for col in nuevo.columns:
+            ids = mascara.index[mascara[col]]
+            escrito.loc[ids, col] = nuevo.loc[ids, col].astype(object)
+        estado['escrito'] = escrito
+    return f"{filas_pg} filas; {n_pozos} pozos / {n_cols} columnas con cambios", filas_pg
+
+def estado_sheet():
+    # Último CSV descargado y su DataFrame ya limpio, compartido entre ciclos del proceso
+    return {'lock': threading.Lock(), 'meta': None, 'payload': None, 'df': None}
+
+def _normalizar_columna(col):
+    return col.strip().replace('\n', ' ')
+
+def parsear_sheet(payload):
+    # El encabezado se lee primero con el mismo motor 'c' para proyectar columnas y fijar tipos sobre
+    # los nombres que éste asigna ('Unnamed: N' para vacíos, 'X.1' para repetidos), igual que INFORME
+    import pandas as pd
+    encabezado = pd.read_csv(io.BytesIO(payload), engine='c', nrows=0).columns
+    crudos = {col: _normalizar_columna(col) for col in encabezado}
+    usecols = [col for col, norm in crudos.items() if norm in ESQUEMA_SHEET] if SHEET_PROYECTAR else None
+    dtype = {col: str for col, norm in crudos.items() if ESQUEMA_SHEET.get(norm) in ('texto', 'numero')}
+    df = pd.read_csv(io.BytesIO(payload), engine='c', usecols=usecols, dtype=dtype)
+    df.columns = [_normalizar_columna(col) for col in df.columns]
+
+    for col, tipo in ESQUEMA_SHEET.items():
+        if col not in df.columns:
+            continue
+        if tipo == 'numero':
+            # Lo que no es número se conserva como texto, igual que antes en la limpieza para Postgres
+            crudo = df[col]
+            num = pd.to_numeric(crudo.str.replace(',', '', regex=False).str.strip(), errors='coerce')
+            df[col] = num if num.notna().sum() == crudo.notna().sum() else num.where(num.notna() | crudo.isna(), crudo)
+        elif tipo == 'fecha':
+            df[col] = pd.to_datetime(df[col], format=SHEET_FORMATO_FECHA, errors='coerce')
+    return df
+
+def _cargar_cache_sheet(estado):
+    ruta_csv = os.path.join(CACHE_DIR, 'informe.csv')
+    ruta_meta = os.path.join(CACHE_DIR, 'informe.json')
+    if estado['payload'] is None and os.path.exists(ruta_csv) and os.path.exists(ruta_meta):
+        with open(ruta_meta, encoding='utf-8') as f: estado['meta'] = json.load(f)
+        with open(ruta_csv, 'rb') as f: estado['payload'] = f.read()
+
+def _guardar_cache_sheet(estado):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(os.path.join(CACHE_DIR, 'informe.csv'), 'wb') as f: f.write(estado['payload'])
+    with open(os.path.join(CACHE_DIR, 'informe.json'), 'w', encoding='utf-8') as f: json.dump(estado['meta'], f)
+
+def leer_sheet(estado, etapas, url=CSV_URL):
+    # GET condicional: con 304 o con el mismo hash se reutiliza el DataFrame ya limpio;
+    # si la descarga falla se trabaja con la última copia buena.
+    with estado['lock']:
+        t0 = time.time()
+        _cargar_cache_sheet(estado)
+        meta = estado['meta'] or {}
+        headers = {}
+        if meta.get('etag'): headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'): headers['If-Modified-Since'] = meta['last_modified']
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=SHEET_TIMEOUT) as resp:
+                payload = resp.read()
+                etag, last_modified = resp.headers.get('ETag'), resp.headers.get('Last-Modified')
+            origen = 'nuevo'
+        except urllib.error.HTTPError as e:
+            if estado['payload'] is None: raise
+            payload, origen = estado['payload'], ('sin cambios' if e.code == 304 else 'respaldo')
+            etag, last_modified = meta.get('etag'), meta.get('last_modified')
+        except (urllib.error.URLError, OSError):
+            if estado['payload'] is None: raise
+            payload, origen = estado['payload'], 'respaldo'
+            etag, last_modified = meta.get('etag'), meta.get('last_modified')
+
+        digest = hashlib.sha256(payload).hexdigest()
+        if digest == meta.get('sha256') and origen == 'nuevo':
+            origen = 'sin cambios'
+        etapas.registrar('sheet_descarga', s=time.time() - t0, bytes=len(payload), origen=origen)
+        with etapas.medir('sheet_parseo', bytes=len(payload)) as m:
+            m['reutilizado'] = estado['df'] is not None and digest == meta.get('sha256')
+            if not m['reutilizado']:
+                estado['df'] = parsear_sheet(payload)
+            m['filas_out'] = len(estado['df'])
+        if digest != meta.get('sha256') or etag != meta.get('etag') or last_modified != meta.get('last_modified'):
+            estado['payload'] = payload
+            estado['meta'] = {'etag': etag, 'last_modified': last_modified, 'sha256': digest}
+            _guardar_cache_sheet(estado)
+        # Copia: la inyección SCADA escribe sobre df
+        return estado['df'].copy(), origen
+
+def leer_scada(eng, recursos, tags, etapas):
+    with etapas.medir('scada', filas_in=len(tags)) as m:
+        conn_s = eng.raw_connection()
+        try:
+            resolucion, no_resueltos, duplicados = resolver_gateids(conn_s, recursos['gateids'], tags)
+            df_scada, sin_dato, n_nuevas, tiempos = consultar_ultimos_valores(eng, conn_s, resolucion, recursos['marcas'])
+        finally:
+            conn_s.close()
+        m.update(filas_out=len(df_scada), muestras_nuevas=n_nuevas, shards=len(tiempos))
+    return {'df': df_scada, 'sin_dato': sin_dato, 'sin_gateid': no_resueltos, 'gateid_duplicado': duplicados,
+            'nuevas': n_nuevas, 'shards': tiempos}
+
+class Etapas:
+    # Tiempos y volúmenes (filas/bytes de entrada y salida) por etapa de una ejecución
+    def __init__(self):
+        self.datos = {}
+
+    def registrar(self, etapa, s, **extra):
+        self.datos[etapa] = dict(extra, s=round(s, 3))
+
+    @contextmanager
+    def medir(self, etapa, **extra):
+        registro = dict(extra)
+        t0 = time.time()
+        try:
+            yield registro
+        finally:
+            self.registrar(etapa, time.time() - t0, **registro)
+
+def registrar_historial(registro):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    lineas = []
+    if os.path.exists(HISTORIAL_ARCHIVO):
+        with open(HISTORIAL_ARCHIVO, encoding='utf-8') as f: lineas = f.readlines()
+    lineas = lineas[-(HISTORIAL_MAX - 1):] + [json.dumps(registro, ensure_ascii=False, default=str) + '\n']
+    with open(HISTORIAL_ARCHIVO, 'w', encoding='utf-8') as f: f.writelines(lineas)
+
+def leer_historial(n=HISTORIAL_N):
+    if not os.path.exists(HISTORIAL_ARCHIVO):
+        return []
+    with open(HISTORIAL_ARCHIVO, encoding='utf-8') as f:
+        return [json.loads(linea) for linea in f.readlines()[-n:] if linea.strip()]
+
+def percentiles_etapas(historial):
+    # p50/p95 de segundos por etapa sobre las últimas ejecuciones
+    import pandas as pd
+    filas = [{'etapa': etapa, 's': datos['s']} for reg in historial for etapa, datos in reg.get('etapas', {}).items()]
+    filas += [{'etapa': 'total', 's': reg['total_s']} for reg in historial if 'total_s' in reg]
+    if not filas:
+        return pd.DataFrame(columns=['p50', 'p95', 'n'])
+    agrupado = pd.DataFrame(filas).groupby('etapa')['s']
+    return pd.DataFrame({'p50': agrupado.quantile(0.5), 'p95': agrupado.quantile(0.95), 'n': agrupado.size()}).round(3)
+
+def _a_columnar(df):
+    # Parquet no admite columnas object con número y texto mezclados (pasa en columnas libres del sheet)
+    import pandas as pd
+    df = df.reset_index(drop=True).copy()
+    for col in df.columns:
+        if df[col].dtype == object:
+            tipo = pd.api.types.infer_dtype(df[col], skipna=True)
+            if tipo == 'decimal':
+                df[col] = pd.to_numeric(df[col])
+            elif tipo.startswith('mixed') and tipo != 'mixed-integer-float':
+                df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+def guardar_captura(ruta, payload_sheet, df_scada, df, payload_pg):
+    os.makedirs(ruta, exist_ok=True)
+    with open(os.path.join(ruta, 'sheet.csv'), 'wb') as f: f.write(payload_sheet)
+    for nombre, frame in (('scada', df_scada), ('informe', df), ('pozos', payload_pg)):
+        _a_columnar(frame).to_parquet(os.path.join(ruta, f'{nombre}.parquet'), index=False)
+    # Sólo se podan carpetas de captura (fecha_hora con sheet.csv dentro); el orden alfabético es el cronológico
+    raiz = os.path.dirname(ruta)
+    capturas = sorted(nombre for nombre in os.listdir(raiz) if _es_captura(raiz, nombre))
+    for vieja in capturas[:-CAPTURA_MAX]:
+        shutil.rmtree(os.path.join(raiz, vieja), ignore_errors=True)
+
+def _es_captura(raiz, nombre):
+    try:
+        datetime.datetime.strptime(nombre, CAPTURA_FORMATO)
+    except ValueError:
+        return False
+    return os.path.isfile(os.path.join(raiz, nombre, 'sheet.csv'))
+
+def cargar_captura(ruta):
+    import pandas as pd
+    with open(os.path.join(ruta, 'sheet.csv'), 'rb') as f: payload = f.read()
+    captura = {'ruta': ruta, 'sheet': payload}
+    for nombre in ('scada', 'informe', 'pozos'):
+        captura[nombre] = pd.read_parquet(os.path.join(ruta, f'{nombre}.parquet'))
+    return captura
+
+def _mismo_frame(actual, capturado):
+    import pandas as pd
+    try:
+        pd.testing.assert_frame_equal(_a_columnar(actual), capturado, check_dtype=False, check_index_type=False)
+        return True
+    except AssertionError:
+        return False
+
+def reproducir_captura(captura, recursos, etapas):
+    # Transformación y escritura desde una captura, contra los motores de recursos (BD locales).
+    # Reusar los mismos recursos entre repeticiones mide el ciclo en caliente (snapshots ya cargados).
+    with etapas.medir('sheet_parseo', bytes=len(captura['sheet'])) as m:
+        df = parsear_sheet(captura['sheet'])
+        m['filas_out'] = len(df)
+    with etapas.medir('inyeccion', filas_in=len(captura['scada'])) as m:
+        m['filas_out'] = inyectar_valores_scada(df, captura['scada'], recursos['registro'].tabla)
+    coincide = {'informe': _mismo_frame(df, captura['informe']), 'pozos': _mismo_frame(payload_pozos(df), captura['pozos'])}
+    return coincide, _escribir_destinos(recursos, df, etapas)
+
+def ejecutar_en_paralelo(tareas):
+    # Cada tarea corre en su propio hilo con su propio cronómetro; una falla en una no aborta a las demás
+    def cronometrar(fn):
+        t0 = time.time()
+        try:
+            return True, fn(), round(time.time() - t0, 2)
+        except Exception as e:
+            return False, str(e), round(time.time() - t0, 2)
+    with ThreadPoolExecutor(max_workers=len(tareas)) as pool:
+        futuros = {nombre: pool.submit(cronometrar, fn) for nombre, fn in tareas.items()}
+        return {nombre: fut.result() for nombre, fut in futuros.items()}
+
+class VueloUnico:
+    # Una sola ejecución en vuelo por proceso: las llamadas que llegan mientras corre
+    # no lanzan otra, esperan y reciben el resultado de la que ya está en curso.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._actual = None
+
+    def ejecutar(self, fn):
+        with self._lock:
+            lider = self._actual is None
+            if lider:
+                self._actual = Future()
+            futuro = self._actual
+        if not lider:
+            return futuro.result()
+        try:
+            resultado = fn()
+            futuro.set_result(resultado)
+            return resultado
+        except BaseException as e:
+            futuro.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._actual = None
+
+    def en_vuelo(self):
+        with self._lock:
+            return self._actual is not None
+
+def crear_recursos(db_scada, db_informe, db_postgres, csv_url=CSV_URL, registro=REGISTRO_SCADA, motores=None, captura=CAPTURA_DIR):
+    # Todo el estado de proceso que necesita una sincronización: pools, cachés, marcas de agua
+    # y el candado de vuelo único. Quien lo crea debe conservarlo entre ciclos.
+    return {'motores': motores or crear_motores(db_scada, db_informe, db_postgres),
+            'csv_url': csv_url, 'registro': registro, 'captura': captura,
+            'informe': estado_informe(), 'sheet': estado_sheet(), 'gateids': estado_gateids(),
+            'marcas': estado_marcas(), 'pozos': estado_pozos(), 'vuelo': VueloUnico()}
+
+def ejecutar_sincronizacion_total(recursos, reportar=lambda pct, texto: None):
+    # Corre las etapas y deja el registro de tiempos/volúmenes en el historial local
+    etapas = Etapas()
+    inicio = datetime.datetime.now(zona_local)
+    captura = os.path.join(recursos['captura'], inicio.strftime(CAPTURA_FORMATO)) if recursos.get('captura') else None
+    t0 = time.time()
+    logs = _sincronizar_etapas(recursos, reportar, etapas, t0, captura)
+    resultado = 'exitosa' if any(l.startswith("🚀") for l in logs) else ('parcial' if any(l.startswith("⚠️ SINCRO PARCIAL") for l in logs) else 'error')
+    registro = {'inicio': inicio.isoformat(), 'total_s': round(time.time() - t0, 3),
+                'resultado': resultado, 'etapas': etapas.datos}
+    try:
+        registrar_historial(registro)
+        if captura and os.path.isdir(captura):
+            with open(os.path.join(captura, 'corrida.json'), 'w', encoding='utf-8') as f:
+                json.dump(dict(registro, logs=logs), f, ensure_ascii=False, default=str)
+    except OSError:
+        pass
+    return logs
+
+def _escribir_destinos(recursos, df, etapas):
+    # 3. MySQL (Tabla INFORME) y 4. Postgres (QGIS) en paralelo: servidores independientes, df de sólo lectura
+    motores = recursos['motores']
+
+    def sink_mysql():
+        with etapas.medir('mysql', filas_in=len(df)) as m:
+            resumen, m['filas_out'] = escribir_informe(motores['informe'], df, recursos['informe'])
+        return resumen
+
+    def sink_postgres():
+        with etapas.medir('postgres', filas_in=len(df)) as m:
+            resumen, m['filas_out'] = escribir_pozos(motores['postgres'], payload_pozos(df), recursos['pozos'])
+        return resumen
+
+    return ejecutar_en_paralelo({'mysql': sink_mysql, 'postgres': sink_postgres})
+
+def _sincronizar_etapas(recursos, reportar, etapas, t0, captura=None):
+    # t0: inicio medido en ejecutar_sincronizacion_total, el mismo que da total_s en el historial
+    logs = []
+    reportar(0, "Preparando sincronización... 0%")
+    
+    try:
+        # 1. Google Sheets y 2. SCADA en paralelo: la consulta SCADA sólo depende del registro de tags
+        reportar(10, "Leyendo Google Sheets y consultando SCADA... 10%")
+        motores = recursos['motores']
+        tabla_scada = recursos['registro'].tabla
+        all_tags = list(recursos['registro'].tags)
+        
+        fuentes = ejecutar_en_paralelo({
+            'sheet': lambda: leer_sheet(recursos['sheet'], etapas, recursos['csv_url']),
+            'scada': lambda: leer_scada(motores['scada'], recursos, all_tags, etapas),
+        })
+        ok_sh, res_sh, t_sh = fuentes['sheet']
+        ok_sc, res_sc, t_sc = fuentes['scada']
+        if not ok_sh:
+            return [f"❌ Error crítico: Google Sheets: {res_sh}"]
+        if not ok_sc:
+            return [f"❌ Error crítico: SCADA: {res_sc}"]
+        df, origen_sheet = res_sh
+        df_scada = res_sc['df']
+        tags_sin_dato, tags_sin_gateid = res_sc['sin_dato'], res_sc['sin_gateid']
+        
+        if 'POZOS' not in df.columns:
+            return [f"❌ Error: No se encontró la columna 'POZOS'. Verifique el Excel."]
+        
+        logs.append(f"✅ Google Sheets: {len(df)} registros leídos ({origen_sheet}) [{t_sh} s].")
+        logs.append(f"📡 SCADA: {len(df_scada)} tags con valor, {res_sc['nuevas']} muestras nuevas [{t_sc} s].")
+        if len(res_sc['shards']) > 1:
+            logs.append(f"🧩 SCADA: {len(res_sc['shards'])} shards de ≤{SCADA_TAGS_POR_SHARD} tags [{', '.join(f'{t} s' for t in res_sc['shards'])}].")
+        if tags_sin_gateid:
+            logs.append(f"⚠️ SCADA: {len(tags_sin_gateid)} tags sin GATEID en VfiTagRef ({_resumir(tags_sin_gateid)}).")
+        if res_sc['gateid_duplicado']:
+            logs.append(f"⚠️ SCADA: {len(res_sc['gateid_duplicado'])} tags con más de un GATEID en VfiTagRef; se usa la muestra más reciente ({_resumir(res_sc['gateid_duplicado'])}).")
+        if tags_sin_dato:
+            logs.append(f"⚠️ SCADA: {len(tags_sin_dato)} tags sin muestra en {SCADA_VENTANA_HORAS} h ({_resumir(tags_sin_dato)}).")
+        reportar(40, "Inyectando valores SCADA... 40%")
+        
+        with etapas.medir('inyeccion', filas_in=len(df_scada)) as m:
+            n_inyectados = inyectar_valores_scada(df, df_scada, tabla_scada)
+            m['filas_out'] = n_inyectados
+        logs.append(f"🧬 SCADA: {n_inyectados} valores inyectados correctamente.")
+        if captura:
+            # La captura nunca detiene la sincronización
+            try:
+                with recursos['sheet']['lock']:
+                    crudo = recursos['sheet']['payload']
+                with etapas.medir('captura'):
+                    guardar_captura(captura, crudo, df_scada, df, payload_pozos(df))
+                logs.append(f"🎞️ Captura guardada en {captura}.")
+            except Exception as e:
+                logs.append(f"⚠️ Captura: no se pudo guardar ({e}).")
+        reportar(70, "Actualizando INFORME y QGIS (Postgres)... 70%")
+        resultados = _escribir_destinos(recursos, df, etapas)
+        ok_my, res_my, t_my = resultados['mysql']
+        ok_pg, res_pg, t_pg = resultados['postgres']
+        logs.append(f"✅ MySQL: Tabla INFORME actualizada ({res_my}) [{t_my} s]." if ok_my else f"❌ MySQL: {res_my} [{t_my} s]")
+        logs.append(f"🐘 Postgres: Tabla POZOS actualizada ({res_pg}) [{t_pg} s]." if ok_pg else f"❌ Postgres: {res_pg} [{t_pg} s]")
+        
+        logs.append(f"⏱️ DURACIÓN DEL PROCESO: {round(time.time() - t0, 2)} segundos.")
+        if ok_my and ok_pg:
+            logs.append(f"🚀 SINCRO EXITOSA: {datetime.datetime.now(zona_local).strftime('%H:%M:%S')}")
+        else:
+            logs.append(f"⚠️ SINCRO PARCIAL: {datetime.datetime.now(zona_local).strftime('%H:%M:%S')}")
+        
+        reportar(100, "Sincronización finalizada al 100%")
+        return logs
+    except Exception as e:
+        return [f"❌ Error crítico: {str(e)}"]
+
+def sincronizar(recursos, reportar=lambda pct, texto: None):
+    # Punto de entrada único: vuelo único dentro del proceso + GET_LOCK de MySQL entre procesos
+    from sqlalchemy import text
+    def con_candado():
+        with recursos['motores']['informe'].connect() as conn:
+            if not conn.execute(text("SELECT GET_LOCK(:n, 0)"), {'n': SYNC_LOCK_NOMBRE}).scalar():
+                return [f"⏭️ Sincronización omitida: otra instancia ya está sincronizando ({datetime.datetime.now(zona_local).strftime('%H:%M:%S')})."]
+            try:
+                return ejecutar_sincronizacion_total(recursos, reportar)
+            finally:
+                conn.execute(text("SELECT RELEASE_LOCK(:n)"), {'n': SYNC_LOCK_NOMBRE})
+    try:
+        return recursos['vuelo'].ejecutar(con_candado)
+    except Exception as e:
+        return [f"❌ Error crítico: {str(e)}"]
+
+def calcular_proxima(ahora, modo, h_in, m_in):
+    if modo == "Diario":
+        prox = ahora.replace(hour=h_in, minute=m_in, second=0, microsecond=0)
+        if ahora >= prox: prox += datetime.timedelta(days=1)
+    else:
+        # Modo Periódico (m_in como intervalo)
+        intervalo = m_in if m_in > 0 else 1
+        total_m = ahora.hour * 60 + ahora.minute
+        sig = ((total_m // intervalo) + 1) * intervalo
+        prox = ahora.replace(hour=0, minute=0, second=0, microsecond=0) + datetime.timedelta(minutes=sig)
+    return prox
+
+class Planificador:
+    # Hilo de fondo dueño del horario Diario/Periódico: corre la sincronización fuera del
+    # hilo de la interfaz y publica su estado; las pestañas sólo leen instantaneas().
+    def __init__(self, recursos):
+        self.recursos = recursos
+        self._lock = threading.Lock()
+        self._despertar = threading.Event()
+        self.config = {'activo': False, 'modo': "Diario", 'hora': 0, 'minuto': 0}
+        self.estado = {'proxima': None, 'ejecutando': False, 'progreso': 0, 'texto': "",
+                       'logs': ["SISTEMA EN ESPERA..."], 'ultima': None}
+        self._forzar = False
+        self._hilo = threading.Thread(target=self._bucle, name="miaa-planificador", daemon=True)
+        self._hilo.start()
+
+    def configurar(self, **cambios):
+        with self._lock:
+            horario_cambio = any(self.config.get(k) != v for k, v in cambios.items() if k != 'activo')
+            self.config.update(cambios)
+            self.estado['proxima'] = None
+            if horario_cambio and not self.estado['ejecutando']:
+                self.estado['logs'] = ["SISTEMA EN ESPERA (Configuración actualizada)..."]
+        self._despertar.set()
+
+    def forzar(self):
+        # Si ya hay una carga en curso el disparo se funde con ella y comparte su resultado
+        with self._lock:
+            if self.estado['ejecutando'] or self.recursos['vuelo'].en_vuelo():
+                return
+            self._forzar = True
+        self._despertar.set()
+
+    def instantanea(self):
+        with self._lock:
+            return dict(self.config), dict(self.estado, logs=list(self.estado['logs']))
+
+    def _reportar(self, pct, texto):
+        with self._lock:
+            self.estado['progreso'], self.estado['texto'] = pct, texto
+
+    def _bucle(self):
+        while True:
+            with self._lock:
+                ahora = datetime.datetime.now(zona_local)
+                cfg = self.config
+                if cfg['activo'] and self.estado['proxima'] is None:
+                    self.estado['proxima'] = calcular_proxima(ahora, cfg['modo'], cfg['hora'], cfg['minuto'])
+                elif not cfg['activo']:
+                    self.estado['proxima'] = None
+                prox = self.estado['proxima']
+                toca = self._forzar or (prox is not None and ahora >= prox)
+                self._forzar = False
+            if toca:
+                self._ejecutar()
+                continue
+            espera = 60 if prox is None else min(60, max(0.05, (prox - ahora).total_seconds()))
+            self._despertar.wait(espera)
+            self._despertar.clear()
+
+    def _ejecutar(self):
+        with self._lock:
+            self.estado.update(ejecutando=True, progreso=0, texto="", logs=[])
+        logs = sincronizar(self.recursos, self._reportar)
+        with self._lock:
+            self.estado.update(ejecutando=False, logs=logs, ultima=datetime.datetime.now(zona_local), proxima=None)
+
+# --- 3. EJECUCIÓN SIN INTERFAZ ---
+# python -m sincronizacion sync --once                       (cron: una corrida, código de salida)
+#   0 exitosa u omitida por candado, 1 error o credenciales inválidas, 2 uso incorrecto (argparse), 3 parcial
+# python -m sincronizacion sync --daemon --modo Periódico --minuto 15   (systemd: horario propio)
+# python -m sincronizacion arranque                          (import en frío contra el presupuesto)
+
+def cargar_credenciales(ruta=SECRETOS_TOML, entorno=os.environ):
+    # Secciones [db_scada], [db_informe], [db_postgres] del TOML; MIAA_<SECCION>_<CLAVE>
+    # (p. ej. MIAA_DB_POSTGRES_PASS) completa o sustituye cada clave
+    credenciales = {seccion: {} for seccion in SECCIONES_DB}
+    if ruta and os.path.exists(ruta):
+        import tomllib
+        with open(ruta, 'rb') as f: datos = tomllib.load(f)
+        for seccion in SECCIONES_DB:
+            credenciales[seccion].update(datos.get(seccion, {}))
+    for clave, valor in entorno.items():
+        for seccion in SECCIONES_DB:
+            prefijo = f"MIAA_{seccion.upper()}_"
+            if clave.startswith(prefijo):
+                nombre = clave[len(prefijo):].lower()
+                credenciales[seccion][nombre] = int(valor) if nombre == 'port' and valor.isdigit() else valor
+    faltan = [seccion for seccion, datos in credenciales.items() if not datos]
+    if faltan:
+        raise ValueError(f"Faltan credenciales para {', '.join(faltan)} (TOML {ruta} o variables MIAA_<SECCION>_<CLAVE>)")
+    return credenciales
+
+def reportar_consola(pct, texto):
+    print(f"[{datetime.datetime.now(zona_local).strftime('%H:%M:%S')}] {texto}", file=sys.stderr, flush=True)
+
+def codigo_salida(logs):
+    # 0 exitosa u omitida por candado, 3 parcial, 1 error; el 2 queda para los errores de uso de argparse
+    if any(l.startswith("🚀") or l.startswith("⏭️") for l in logs):
+        return 0
+    return 3 if any(l.startswith("⚠️ SINCRO PARCIAL") for l in logs) else 1
+
+def ejecutar_demonio(recursos, modo, hora, minuto, reportar=reportar_consola):
+    # Mismo horario que el Planificador; SIGTERM/SIGINT esperan a que termine la corrida en curso
+    detener = threading.Event()
+    for senal in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(senal, lambda *_: detener.set())
+    while not detener.is_set():
+        ahora = datetime.datetime.now(zona_local)
+        prox = calcular_proxima(ahora, modo, hora, minuto)
+        print(f"⏰ Próxima sincronización: {prox.strftime('%Y-%m-%d %H:%M:%S')}", flush=True)
+        if detener.wait((prox - ahora).total_seconds()):
+            break
+        for linea in sincronizar(recursos, reportar):
+            print(linea, flush=True)
+    return 0
+
+def informe_arranque(modulo='sincronizacion', n=8):
+    # Import en frío con -X importtime en un intérprete nuevo: total del módulo, los más caros por
+    # tiempo propio y qué dependencias pesadas quedaron cargadas
+    codigo = (f"import sys, {modulo}\n"
+              f"print(','.join(m for m in {MODULOS_PESADOS!r} if m in sys.modules))")
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', codigo], capture_output=True, text=True,
+                          cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+    modulos = []
+    for linea in proc.stderr.splitlines():
+        if not linea.startswith('import time:') or 'self [us]' in linea:
+            continue
+        propio, acumulado, nombre = linea[len('import time:'):].split('|')
+        modulos.append((nombre.strip(), int(propio), int(acumulado)))
+    total_us = next(acumulado for nombre, _, acumulado in reversed(modulos) if nombre == modulo)
+    caros = sorted(modulos, key=lambda m: m[1], reverse=True)[:n]
+    pesados = [m for m in proc.stdout.strip().split(',') if m]
+    return {'modulo': modulo, 'total_ms': round(total_us / 1000, 1), 'presupuesto_ms': PRESUPUESTO_IMPORT_MS,
+            'pesados': pesados, 'dentro': total_us / 1000 <= PRESUPUESTO_IMPORT_MS and not pesados,
+            'mas_caros': [(nombre, round(propio / 1000, 1)) for nombre, propio, _ in caros]}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sincronizacion', description="Sincronización MIAA sin interfaz")
+    comandos = parser.add_subparsers(dest='comando', required=True)
+    p_sync = comandos.add_parser('sync', help="SCADA + Google Sheets → INFORME / \"Pozos\"")
+    ejecucion = p_sync.add_mutually_exclusive_group()
+    ejecucion.add_argument('--once', action='store_true', help="Una sola corrida (por omisión)")
+    ejecucion.add_argument('--daemon', action='store_true', help="Corre indefinidamente según --modo/--hora/--minuto")
+    p_sync.add_argument('--modo', choices=["Diario", "Periódico"], default="Periódico")
+    p_sync.add_argument('--hora', type=int, default=0)
+    p_sync.add_argument('--minuto', type=int, default=15, help="Minuto del día (Diario) o intervalo en minutos (Periódico)")
+    p_sync.add_argument('--secretos', default=SECRETOS_TOML, help="TOML con [db_scada], [db_informe], [db_postgres]")
+    p_sync.add_argument('--captura', default=CAPTURA_DIR, help="Carpeta para capturar cada corrida (ver reproducir_sync.py)")
+    p_sync.add_argument('--silencioso', action='store_true', help="Sin progreso en stderr")
+    p_arranque = comandos.add_parser('arranque', help="Tiempo de import en frío contra PRESUPUESTO_IMPORT_MS")
+    p_arranque.add_argument('--modulo', default='sincronizacion')
+    args = parser.parse_args(argv)
+
+    if args.comando == 'arranque':
+        informe = informe_arranque(args.modulo)
+        print(f"{'✅' if informe['dentro'] else '❌'} import {informe['modulo']}: {informe['total_ms']} ms (presupuesto {informe['presupuesto_ms']} ms)")
+        print(f"   pesados cargados al importar: {', '.join(informe['pesados']) or 'ninguno'}")
+        for nombre, ms in informe['mas_caros']:
+            print(f"   {ms:>8} ms  {nombre}")
+        return 0 if informe['dentro'] else 1
+
+    try:
+        credenciales = cargar_credenciales(args.secretos)
+    except ValueError as e:
+        print(f"❌ credenciales: {e}", file=sys.stderr)
+        return 1
+    recursos = crear_recursos(credenciales['db_scada'], credenciales['db_informe'], credenciales['db_postgres'], captura=args.captura)
+    reportar = (lambda pct, texto: None) if args.silencioso else reportar_consola
+    try:
+        if args.daemon:
+            return ejecutar_demonio(recursos, args.modo, args.hora, args.minuto, reportar)
+        logs = sincronizar(recursos, reportar)
+        for linea in logs:
+            print(linea, flush=True)
+        return codigo_salida(logs)
+    finally:
+        for eng in recursos['motores'].values():
+            eng.dispose()
+
+if __name__ == '__main__':
+    sys.exit(main())
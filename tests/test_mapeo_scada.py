@@ -0,0 +1,14 @@
+import pytest
+
+from mapeo_scada import MAPEO_SCADA, SUFIJOS, ErrorMapeo, RegistroScada
+
+
+def test_p069a_conserva_los_tags_que_estaban_vigentes():
+    assert MAPEO_SCADA['P-069A']['GASTO_(l.p.s.)'] == 'PZ_070A_TRCANT_CAU_INS'
+    assert 'P-070A' not in MAPEO_SCADA
+
+
+@pytest.mark.parametrize('pozo', ['P-', 'p-001', 'P001', ' P-001'])
+def test_registro_rechaza_nombres_de_pozo_invalidos(pozo):
+    with pytest.raises(ErrorMapeo, match='nombre de pozo inválido'):
+        RegistroScada([('P-001', 'PZ_001'), (pozo, 'PZ_999')], SUFIJOS, {})
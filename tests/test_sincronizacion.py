@@ -0,0 +1,98 @@
+import io
+
+import pandas as pd
+import pytest
+
+import sincronizacion as sync
+
+
+class _Conexion:
+    def close(self):
+        pass
+
+
+class _Motor:
+    def raw_connection(self):
+        return _Conexion()
+
+
+@pytest.fixture
+def historiador(monkeypatch, tmp_path):
+    # Histórico en memoria con la misma semántica que _consultar_max_fecha: último renglón por GATEID desde "desde"
+    muestras = []
+    reloj = {'ahora': None}
+
+    def max_fecha(conn, gateids, desde):
+        df = pd.DataFrame(muestras, columns=['GATEID', 'VALUE', 'FECHA'])
+        df = df[df['GATEID'].isin(gateids) & (df['FECHA'] >= desde)]
+        return df.sort_values('FECHA').drop_duplicates('GATEID', keep='last')
+
+    monkeypatch.setattr(sync, 'CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(sync, '_consultar_max_fecha', max_fecha)
+    monkeypatch.setattr(sync, '_ahora_db', lambda conn: reloj['ahora'])
+    return muestras, reloj
+
+
+@pytest.mark.parametrize('tags_por_shard', [1, 400])
+def test_marca_de_agua_por_tag_con_reloj_adelantado(historiador, monkeypatch, tags_por_shard):
+    muestras, reloj = historiador
+    monkeypatch.setattr(sync, 'SCADA_TAGS_POR_SHARD', tags_por_shard)
+    resolucion = pd.DataFrame({'NAME': ['A', 'B'], 'GATEID': [1, 2]})
+    estado = sync.estado_marcas()
+
+    # B llega con el reloj de su RTU dos horas adelantado
+    muestras += [(1, 10.0, pd.Timestamp('2026-10-17 11:59')), (2, 20.0, pd.Timestamp('2026-10-17 14:00'))]
+    reloj['ahora'] = pd.Timestamp('2026-10-17 12:00')
+    sync.consultar_ultimos_valores(_Motor(), None, resolucion, estado)
+
+    muestras.append((1, 11.0, pd.Timestamp('2026-10-17 12:05')))
+    reloj['ahora'] = pd.Timestamp('2026-10-17 12:06')
+    df_scada, sin_dato, _, _ = sync.consultar_ultimos_valores(_Motor(), None, resolucion, estado)
+
+    valores = df_scada.set_index('NAME')
+    assert valores.loc['A', 'VALUE'] == 11.0
+    assert valores.loc['A', 'FECHA'] == pd.Timestamp('2026-10-17 12:05')
+    assert valores.loc['B', 'VALUE'] == 20.0
+    assert sin_dato == []
+
+
+def test_banda_muerta_deja_pasar_un_paso_de_redondeo():
+    previo = pd.DataFrame({'ID': ['1', '2', '3', '4'], '_Caudal': [0.01, 1.23, 7.5, 3.0]}).set_index('ID').astype(object)
+    payload = pd.DataFrame({'ID': ['1', '2', '3', '4'], '_Caudal': [0.02, 1.24, 7.5, 3.004]})
+    _, mascara = sync.celdas_cambiadas(payload, previo)
+    assert mascara['_Caudal'].tolist() == [True, True, False, False]
+
+
+@pytest.mark.parametrize('logs, codigo', [
+    (["🚀 SINCRO EXITOSA"], 0),
+    (["⏭️ omitida: otra corrida tiene el candado"], 0),
+    (["⚠️ SINCRO PARCIAL: falló Postgres"], 3),
+    (["❌ MySQL: sin conexión"], 1),
+])
+def test_codigo_salida_no_choca_con_argparse(logs, codigo):
+    assert sync.codigo_salida(logs) == codigo
+
+
+def test_sheet_con_encabezados_vacios_y_repetidos_como_el_motor_c():
+    payload = ("POZOS,GASTO_(l.p.s.),,GASTO_(l.p.s.),OBS,OBS,ALTA\n"
+               "P-001,\"1,234.5\",x,7,a,b,2024-01-05\n"
+               "P-002,3,,8,c,d,2024-02-01\n").encode('utf-8')
+    df = sync.parsear_sheet(payload)
+    assert list(df.columns) == list(pd.read_csv(io.BytesIO(payload)).columns)
+    assert list(df.columns) == ['POZOS', 'GASTO_(l.p.s.)', 'Unnamed: 2', 'GASTO_(l.p.s.).1', 'OBS', 'OBS.1', 'ALTA']
+    assert df['GASTO_(l.p.s.)'].tolist() == [1234.5, 3.0]
+    # Fuera del esquema se infiere igual que antes: la fecha queda como texto
+    assert df['ALTA'].tolist() == ['2024-01-05', '2024-02-01']
+
+
+class _MotorIntocable:
+    def __getattr__(self, nombre):
+        raise AssertionError(f"INFORME no debe tocarse ({nombre})")
+
+
+def test_informe_con_llave_repetida_falla_sin_tocar_la_tabla():
+    df = pd.DataFrame({'POZOS': ['P-001', 'P-002', 'P-001', None], 'GASTO_(l.p.s.)': [1.0, 2.0, 3.0, 4.0]})
+    estado = sync.estado_informe()
+    with pytest.raises(ValueError, match=r"1 vacías; repetidas: P-001"):
+        sync.escribir_informe(_MotorIntocable(), df, estado)
+    assert estado['snapshot'] is None